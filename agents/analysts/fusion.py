@@ -146,7 +146,8 @@ class IntelligenceFusion:
             fused_direction=fused["direction"],
             fused_confidence=fused["confidence"],
             disagreement=fused["disagreement"],
-            regime=regime
+            regime=regime,
+            price=market_data.current_price
         )
 
     def _regime_to_market_regime(self, regime: Regime) -> MarketRegime:
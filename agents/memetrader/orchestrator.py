@@ -215,6 +215,7 @@ class MemeOrchestrator:
                     fused_direction=fused_direction,
                     fused_confidence=fused_confidence,
                     regime=Regime.VOLATILE,
+                    price=last_price,
                 )
 
                 logger.debug(
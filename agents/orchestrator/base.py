@@ -345,7 +345,8 @@ class Orchestrator:
                         signals=signals,
                         fused_direction=signals[0].direction,
                         fused_confidence=signals[0].confidence,
-                        regime=Regime.UNKNOWN
+                        regime=Regime.UNKNOWN,
+                        price=market_data.current_price
                     )
                 else:
                     direction = sum(s.direction for s in signals) / len(signals)
@@ -355,7 +356,8 @@ class Orchestrator:
                         signals=signals,
                         fused_direction=direction,
                         fused_confidence=confidence,
-                        regime=Regime.UNKNOWN
+                        regime=Regime.UNKNOWN,
+                        price=market_data.current_price
                     )
 
                 intel_list.append(intel)
@@ -452,7 +454,8 @@ class Orchestrator:
                 signals=signals,
                 fused_direction=signals[0].direction,
                 fused_confidence=signals[0].confidence,
-                regime=Regime.UNKNOWN
+                regime=Regime.UNKNOWN,
+                price=market_data.current_price
             )
         else:
             # Simple average fusion
@@ -463,7 +466,8 @@ class Orchestrator:
                 signals=signals,
                 fused_direction=direction,
                 fused_confidence=confidence,
-                regime=Regime.UNKNOWN
+                regime=Regime.UNKNOWN,
+                price=market_data.current_price
             )
         
         logger.info(f"[PIPELINE] {pair}: analyst output: direction={intel.fused_direction:+.3f}, "
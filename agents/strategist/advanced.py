@@ -16,7 +16,8 @@ import logging
 from core.interfaces import IStrategist, ILLM
 from core.models import (
     MarketIntel, Portfolio, TradingPlan, TradeSignal,
-    TradeAction, OrderType, Regime
+    TradeAction, OrderType, Regime,
+    TRADE_ACTION_LOOKUP
 )
 from core.config import Settings, get_settings
 
@@ -337,7 +338,7 @@ Generate your decision as JSON."""
     ) -> TradingPlan:
         """Build TradingPlan from decision"""
         action_str = decision.get("action", "HOLD").upper()
-        action = TradeAction[action_str] if action_str in TradeAction.__members__ else TradeAction.HOLD
+        action = TRADE_ACTION_LOOKUP.get(action_str, TradeAction.HOLD)
 
         # Calculate stop loss with strategy multiplier
         base_stop = risk["stop_loss_pct"]
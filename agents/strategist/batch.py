@@ -5,19 +5,28 @@ Analyzes multiple trading pairs in a single Claude API call.
 Reduces API costs by ~66% (3 calls -> 1 call for 3 pairs).
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import asyncio
+import inspect
+import io
 import logging
 import json
 
 from core.interfaces import IStrategist, ILLM
 from core.models import (
     MarketIntel, Portfolio, TradingPlan, TradeSignal,
-    TradeAction, TradeStatus, OrderType
+    TradeAction, TradeStatus, OrderType,
+    TRADE_ACTION_LOOKUP
 )
 from core.config import Settings, get_settings
+from .cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Decodes one JSON value from an offset, ignoring whatever text follows it
+_JSON_DECODER = json.JSONDecoder()
+
 
 # System prompt for batch analysis
 BATCH_SYSTEM_PROMPT = """Crypto trading strategist. Analyze MULTIPLE pairs, return JSON array of decisions.
@@ -26,8 +35,18 @@ Rules per pair: direction>+0.3 & confidence>0.55→BUY, direction<-0.3 & confide
 Match confidence to signal strength. Consider portfolio-wide exposure for sizing. Respond with JSON only."""
 
 
-# Batch analysis prompt template
-BATCH_ANALYSIS_PROMPT = """Portfolio: {portfolio_summary}
+# Batch analysis prompt, rendered with an f-string so the constant template
+# is not re-parsed by str.format() on every call
+def render_batch_prompt(
+    portfolio_summary: str,
+    all_intel_summaries: str,
+    max_position_pct: float,
+    max_exposure_pct: float,
+    stop_loss_pct: float,
+    min_confidence: float
+) -> str:
+    """Render the batch analysis prompt for all pairs."""
+    return f"""Portfolio: {portfolio_summary}
 
 All Pairs Intel:
 {all_intel_summaries}
@@ -35,11 +54,128 @@ All Pairs Intel:
 Risk: max_position={max_position_pct:.0%}, max_exposure={max_exposure_pct:.0%}, stop_loss={stop_loss_pct:.0%}, min_confidence={min_confidence:.0%}
 Strategies: TREND_FOLLOW, MEAN_REVERT, ACCUMULATE, RISK_OFF
 
-Return JSON array, one per pair:
-[{{"pair":"...","action":"BUY|SELL|HOLD","confidence":0.0-1.0,"size_pct":0.0-{max_position_pct},"strategy":"...","reasoning":"brief","key_factors":["..."]}}]
+Return JSON array, one per pair (reasoning max 12 words):
+[{{"pair":"...","action":"BUY|SELL|HOLD","confidence":0.0-1.0,"size_pct":0.0-{max_position_pct},"strategy":"...","reasoning":"..."}}]
 Return decisions for ALL pairs."""
 
 
+# Rough prompt size estimate used to keep batches inside the context window
+CHARS_PER_TOKEN = 4
+
+# Callers that can wait at least this long are routed to the Message Batches API.
+# Message batches typically take minutes, so shorter budgets would mostly time out.
+DEFERRED_BATCH_MIN_LATENCY_MS = 600_000
+
+
+# Structured output schema: Claude returns {"decisions": [...]} as tool input
+BATCH_DECISIONS_TOOL = {
+    "name": "trade_decisions",
+    "description": "Record one trading decision per analyzed pair.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "decisions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "pair": {"type": "string"},
+                        "action": {"type": "string", "enum": ["BUY", "SELL", "HOLD"]},
+                        "confidence": {"type": "number"},
+                        "size_pct": {"type": "number"},
+                        "strategy": {"type": "string"},
+                        "reasoning": {"type": "string"}
+                    },
+                    "required": ["pair", "action", "confidence"]
+                }
+            }
+        },
+        "required": ["decisions"]
+    }
+}
+
+
+@dataclass(frozen=True)
+class PromptProfile:
+    """
+    Prompt wording and request shape for a BatchStrategist.
+
+    Variants of the batch strategist differ only in these, so they share one
+    implementation and pass their own profile instead of copying the module.
+    """
+    system: str
+    render_prompt: Callable[..., str]
+    max_tokens_fn: Callable[[int], Optional[int]]  # pair count -> max_tokens, None for LLM default
+    tool: Optional[Dict] = None
+
+
+DEFAULT_PROFILE = PromptProfile(
+    system=BATCH_SYSTEM_PROMPT,
+    render_prompt=render_batch_prompt,
+    max_tokens_fn=lambda pair_count: 100 * pair_count + 100,
+    tool=BATCH_DECISIONS_TOOL
+)
+
+
+class _DecisionStreamParser:
+    """
+    Pull complete decision objects out of a JSON array as it streams in.
+
+    A decision is any object whose parent container is an array, so both a
+    bare array and the {"decisions": [...]} tool input shape are handled.
+    """
+
+    def __init__(self):
+        self._stack: List[str] = []  # open "[" / "{" containers
+        self._in_string = False
+        self._escape = False
+        self._depth = 0  # stack depth of the decision being read, 0 if none
+        self._parts: List[str] = []
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """Consume a fragment and return the decisions it completed."""
+        decisions = []
+        stack = self._stack
+        start = 0 if self._depth else None
+
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "[" or char == "{":
+                if char == "{" and not self._depth and stack and stack[-1] == "[":
+                    self._depth = len(stack) + 1
+                    start = i
+                stack.append(char)
+            elif char == "]" or char == "}":
+                if stack:
+                    stack.pop()
+                if self._depth and len(stack) < self._depth:
+                    self._parts.append(chunk[start:i + 1])
+                    text = "".join(self._parts)
+                    self._parts = []
+                    self._depth = 0
+                    start = None
+                    try:
+                        decision = json.loads(text)
+                    except json.JSONDecodeError:
+                        logger.debug("[BATCH_STREAM] Skipping malformed decision: %s", text)
+                    else:
+                        if isinstance(decision, dict):
+                            decisions.append(decision)
+
+        if start is not None:
+            self._parts.append(chunk[start:])
+
+        return decisions
+
+
 class BatchStrategist(IStrategist):
     """
     Cost-optimized strategist that analyzes multiple pairs in a single API call.
@@ -48,9 +184,33 @@ class BatchStrategist(IStrategist):
     Implements IStrategist but with a batch-oriented create_batch_plan method.
     """
 
-    def __init__(self, llm: ILLM, settings: Settings = None):
+    def __init__(
+        self,
+        llm: ILLM,
+        settings: Settings = None,
+        response_cache_ttl: float = 60.0,
+        response_cache_size: int = 128,
+        batch_window_ms: float = 50.0,
+        batch_max_size: Optional[int] = None,
+        profile: PromptProfile = DEFAULT_PROFILE
+    ):
         self.llm = llm
         self.settings = settings or get_settings()
+        self.profile = profile
+
+        # Stream the response when the LLM supports it, so decisions are
+        # parsed (and pooled callers answered) as Claude generates them
+        self._can_stream = inspect.isasyncgenfunction(getattr(llm, "stream_market_analysis", None))
+
+        # Concurrent create_plan callers are pooled into one batch call
+        self._batch_window = batch_window_ms / 1000
+        self._batch_max_size = batch_max_size or self.settings.cost_optimization.max_pairs_per_batch
+        self._pending: List[Tuple[MarketIntel, Portfolio, Optional[Dict], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        # Identical prompts within the TTL reuse the previous LLM response
+        self._response_cache = ResponseCache(response_cache_ttl, response_cache_size)
 
     async def create_plan(
         self,
@@ -60,16 +220,111 @@ class BatchStrategist(IStrategist):
     ) -> TradingPlan:
         """
         Standard single-pair interface for compatibility.
-        Delegates to create_batch_plan with a single intel.
+
+        Calls made together (e.g. one asyncio.gather) are pooled and
+        analyzed in one create_batch_plan call; each caller gets a plan
+        containing only its own pair's signal. When nothing is in flight the
+        pool is dispatched on the next loop iteration, so a lone caller pays
+        no wait; while a batch is running, new calls are held for up to
+        batch_window_ms to pool with each other.
         """
-        plan = await self.create_batch_plan([intel], portfolio, risk_params)
-        return plan
+        if self._batch_window <= 0:
+            return await self.create_batch_plan([intel], portfolio, risk_params)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((intel, portfolio, risk_params, future))
+
+        if len(self._pending) >= self._batch_max_size:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            if self._flush_tasks:
+                self._flush_handle = loop.call_later(self._batch_window, self._flush_pending)
+            else:
+                self._flush_handle = loop.call_soon(self._flush_pending)
+
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Dispatch all queued create_plan calls as batch requests."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        task = asyncio.ensure_future(self._dispatch_pending(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _dispatch_pending(
+        self,
+        pending: List[Tuple[MarketIntel, Portfolio, Optional[Dict], asyncio.Future]]
+    ) -> None:
+        """Run one batch per (portfolio, risk_params) group and resolve callers."""
+        groups: Dict[Tuple[int, int], list] = {}
+        for item in pending:
+            groups.setdefault((id(item[1]), id(item[2])), []).append(item)
+
+        await asyncio.gather(*(self._dispatch_group(items) for items in groups.values()))
+
+    async def _dispatch_group(
+        self,
+        items: List[Tuple[MarketIntel, Portfolio, Optional[Dict], asyncio.Future]]
+    ) -> None:
+        """Analyze one group of pooled calls and hand each caller its signal."""
+        _, portfolio, risk_params, _ = items[0]
+        reasoning = f"Batch analysis of {len(items)} pairs"
+
+        def resolve(signal: TradeSignal) -> None:
+            # Streamed decisions answer their callers before the batch finishes
+            for intel, _, _, future in items:
+                if intel.pair == signal.pair and not future.done():
+                    future.set_result(self._single_pair_plan(intel, signal, "batch_analysis", reasoning))
+
+        try:
+            plan = await self.create_batch_plan(
+                [item[0] for item in items], portfolio, risk_params, on_signal=resolve
+            )
+        except Exception as e:
+            for *_, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        signals_by_pair = {signal.pair: signal for signal in plan.signals}
+        for intel, _, _, future in items:
+            if future.done():
+                continue
+            future.set_result(self._single_pair_plan(
+                intel, signals_by_pair.get(intel.pair), plan.strategy_name, plan.reasoning
+            ))
+
+    @staticmethod
+    def _single_pair_plan(
+        intel: MarketIntel,
+        signal: Optional[TradeSignal],
+        strategy_name: str,
+        reasoning: str
+    ) -> TradingPlan:
+        """Wrap one pair's signal from a pooled batch as that caller's plan."""
+        return TradingPlan(
+            signals=[signal] if signal else [],
+            strategy_name=strategy_name,
+            regime=intel.regime.value,
+            overall_confidence=signal.confidence if signal and signal.action != TradeAction.HOLD else 0.0,
+            reasoning=reasoning
+        )
 
     async def create_batch_plan(
         self,
         intel_list: List[MarketIntel],
         portfolio: Portfolio,
-        risk_params: Dict = None
+        risk_params: Dict = None,
+        latency_budget_ms: Optional[float] = None,
+        on_signal: Optional[Callable[[TradeSignal], None]] = None
     ) -> TradingPlan:
         """
         Create trading plan for multiple pairs in a single Claude call.
@@ -78,6 +333,11 @@ class BatchStrategist(IStrategist):
             intel_list: List of MarketIntel objects for all pairs to analyze
             portfolio: Current portfolio state
             risk_params: Risk parameters (optional, uses settings if not provided)
+            latency_budget_ms: How long the caller can wait. Budgets of at least
+                DEFERRED_BATCH_MIN_LATENCY_MS go through the Message Batches API
+                (half price, minutes of latency) when the LLM supports it.
+            on_signal: Called with each pair's signal as soon as its decision
+                is streamed, before the whole batch has been generated
 
         Returns:
             TradingPlan with signals for all pairs
@@ -97,6 +357,15 @@ class BatchStrategist(IStrategist):
             "min_confidence": self.settings.risk.min_confidence
         }
 
+        # Accuracy drops and latency climbs on very large batches, so shard
+        # them into concurrent calls of at most max_pairs_per_batch pairs
+        max_pairs = self.settings.cost_optimization.max_pairs_per_batch
+        if len(intel_list) > max_pairs:
+            return await self._create_split_plan(
+                intel_list, portfolio, risk, latency_budget_ms, on_signal,
+                parts=-(-len(intel_list) // max_pairs)
+            )
+
         try:
             # Build combined intel summary for all pairs
             all_intel_summaries = self._build_batch_intel_summary(intel_list)
@@ -106,7 +375,7 @@ class BatchStrategist(IStrategist):
             logger.info(f"[BATCH] Analyzing {len(intel_list)} pairs in single call: {pairs_str}")
 
             # Build batch prompt
-            prompt = BATCH_ANALYSIS_PROMPT.format(
+            prompt = self.profile.render_prompt(
                 portfolio_summary=portfolio.to_summary(),
                 all_intel_summaries=all_intel_summaries,
                 max_position_pct=risk["max_position_pct"],
@@ -115,27 +384,60 @@ class BatchStrategist(IStrategist):
                 min_confidence=risk["min_confidence"]
             )
 
-            # Single Claude API call for all pairs
-            response = await self.llm.analyze_market(
-                prompt=prompt,
-                system_prompt=BATCH_SYSTEM_PROMPT,
-                max_tokens=200 * len(intel_list) + 100
-            )
+            # Keep the request inside the context window: an oversized batch is
+            # split and analyzed concurrently, an oversized single pair is held
+            # without spending a call that would fail anyway
+            estimated_tokens = (len(self.profile.system) + len(prompt)) // CHARS_PER_TOKEN
+            max_input_tokens = self.settings.cost_optimization.max_input_tokens
+            if estimated_tokens > max_input_tokens:
+                if len(intel_list) == 1:
+                    raise ValueError(f"Prompt of ~{estimated_tokens} tokens exceeds "
+                                     f"max_input_tokens={max_input_tokens}")
+                return await self._create_split_plan(
+                    intel_list, portfolio, risk, latency_budget_ms, on_signal,
+                    parts=-(-estimated_tokens // max_input_tokens)
+                )
 
-            # Log raw response
-            logger.debug(f"[BATCH_RAW] Response: {response}")
+            # Single Claude API call for all pairs (skipped on an identical recent prompt)
+            cache_key = ResponseCache.key(self.profile.system, prompt)
+            response = self._response_cache.get(cache_key)
+            if response is None:
+                on_decision = None
+                if on_signal is not None:
+                    stop_loss_pct = risk["stop_loss_pct"]
+                    batch_pairs = {intel.pair for intel in intel_list}
+
+                    def on_decision(decision: Dict) -> None:
+                        pair = decision.get("pair")
+                        if pair in batch_pairs:
+                            on_signal(self._decision_to_signal(pair, decision, stop_loss_pct))
+
+                response = await self._analyze(prompt, len(intel_list), latency_budget_ms, on_decision)
+                fresh = True
+            else:
+                logger.info(f"[BATCH] Reusing cached response for {len(intel_list)} pairs")
+                fresh = False
+
+            # Log raw response (str() of a long response only when DEBUG is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[BATCH_RAW] Response: %s", response)
 
-            # Parse batch response
-            signals = self._parse_batch_response(response, intel_list, risk)
+            # Parse batch response. Only a reply that yielded decisions is
+            # cached, so an empty or garbled one isn't replayed for the TTL.
+            decision_map = self._decision_map(response)
+            if fresh and any(intel.pair in decision_map for intel in intel_list):
+                self._response_cache.set(cache_key, response)
+            signals = self._signals_for(intel_list, decision_map, risk["stop_loss_pct"])
 
             # Calculate overall confidence
             confidences = [s.confidence for s in signals if s.action != TradeAction.HOLD]
             overall_confidence = sum(confidences) / len(confidences) if confidences else 0.0
 
-            # Log results
-            for signal in signals:
-                logger.info(f"[BATCH_RESULT] {signal.pair}: {signal.action.value} "
-                           f"confidence={signal.confidence:.0%}")
+            # Log results as a single line for the whole batch
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[BATCH_RESULT] %s", " | ".join(
+                    f"{s.pair}: {s.action.value} confidence={s.confidence:.0%}" for s in signals
+                ))
 
             return TradingPlan(
                 signals=signals,
@@ -148,14 +450,16 @@ class BatchStrategist(IStrategist):
         except Exception as e:
             logger.error(f"Batch strategist error: {e}")
 
-            # Return HOLD for all pairs on error
+            # Return HOLD for all pairs on error (message formatted once)
+            error = str(e)
+            reasoning = f"Batch error: {error}"
             signals = [
                 TradeSignal(
                     pair=intel.pair,
                     action=TradeAction.HOLD,
                     confidence=0.0,
                     size_pct=0.0,
-                    reasoning=f"Batch error: {str(e)}"
+                    reasoning=reasoning
                 )
                 for intel in intel_list
             ]
@@ -164,15 +468,116 @@ class BatchStrategist(IStrategist):
                 signals=signals,
                 strategy_name="batch_error",
                 overall_confidence=0.0,
-                reasoning=f"Batch analysis error: {str(e)}"
+                reasoning=f"Batch analysis error: {error}"
             )
 
+    async def _create_split_plan(
+        self,
+        intel_list: List[MarketIntel],
+        portfolio: Portfolio,
+        risk: Dict,
+        latency_budget_ms: Optional[float],
+        on_signal: Optional[Callable[[TradeSignal], None]],
+        parts: int
+    ) -> TradingPlan:
+        """Analyze an oversized batch as concurrent sub-batches and merge them."""
+        size = -(-len(intel_list) // min(parts, len(intel_list)))
+        chunks = [intel_list[i:i + size] for i in range(0, len(intel_list), size)]
+        logger.info(f"[BATCH] Splitting {len(intel_list)} pairs into {len(chunks)} sub-batches")
+
+        plans = await asyncio.gather(*(
+            self.create_batch_plan(chunk, portfolio, risk, latency_budget_ms, on_signal)
+            for chunk in chunks
+        ))
+
+        signals = [signal for plan in plans for signal in plan.signals]
+        confidences = [s.confidence for s in signals if s.action != TradeAction.HOLD]
+        overall_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+
+        return TradingPlan(
+            signals=signals,
+            strategy_name="batch_analysis",
+            regime="mixed",
+            overall_confidence=overall_confidence,
+            reasoning=f"Batch analysis of {len(intel_list)} pairs in {len(chunks)} sub-batches"
+        )
+
+    async def _analyze(
+        self,
+        prompt: str,
+        pair_count: int,
+        latency_budget_ms: Optional[float] = None,
+        on_decision: Optional[Callable[[Dict], None]] = None
+    ) -> Any:
+        """Send the batch prompt in real time, or deferred if the budget allows."""
+        profile = self.profile
+        options: Dict[str, Any] = {"system_prompt": profile.system}
+        max_tokens = profile.max_tokens_fn(pair_count)
+        if max_tokens is not None:
+            options["max_tokens"] = max_tokens
+        if profile.tool is not None:
+            options["tool"] = profile.tool
+
+        if (
+            latency_budget_ms is not None
+            and latency_budget_ms >= DEFERRED_BATCH_MIN_LATENCY_MS
+            and hasattr(self.llm, "analyze_market_batch")
+        ):
+            logger.info(f"[BATCH] Deferring {pair_count} pairs to Message Batches API "
+                        f"(budget {latency_budget_ms / 1000:.0f}s)")
+            try:
+                results = await self.llm.analyze_market_batch(
+                    [{"custom_id": "batch", "prompt": prompt, **options}],
+                    timeout=latency_budget_ms / 1000
+                )
+            except TimeoutError as e:
+                # Late is better than all-HOLD: pay full price for a real-time answer
+                logger.warning(f"[BATCH] {e}; analyzing in real time instead")
+            else:
+                if "batch" in results:
+                    return results["batch"]
+                logger.warning("[BATCH] Deferred batch request returned no result; analyzing in real time instead")
+
+        if self._can_stream:
+            return await self._analyze_streaming(prompt, options, on_decision)
+
+        return await self.llm.analyze_market(prompt=prompt, **options)
+
+    async def _analyze_streaming(
+        self,
+        prompt: str,
+        options: Dict[str, Any],
+        on_decision: Optional[Callable[[Dict], None]] = None
+    ) -> Any:
+        """
+        Stream the batch response, handing each decision to on_decision as
+        soon as its JSON object is complete.
+
+        Returns the decisions list, or the raw text if no decision could be
+        pulled from the stream so the regular parser can have a go at it.
+        """
+        parser = _DecisionStreamParser()
+        decisions: List[Dict] = []
+        chunks: List[str] = []
+
+        async for chunk in self.llm.stream_market_analysis(prompt=prompt, **options):
+            chunks.append(chunk)
+            for decision in parser.feed(chunk):
+                decisions.append(decision)
+                if on_decision is not None:
+                    on_decision(decision)
+
+        return decisions if decisions else "".join(chunks)
+
     def _build_batch_intel_summary(self, intel_list: List[MarketIntel]) -> str:
-        """Build combined summary for all pairs."""
-        summaries = []
+        """Build combined summary for all pairs in a single write pass."""
+        buf = io.StringIO()
         for i, intel in enumerate(intel_list, 1):
-            summaries.append(f"### Pair {i}: {intel.pair}\n{intel.to_summary()}")
-        return "\n\n".join(summaries)
+            if i > 1:
+                buf.write("\n\n")
+            buf.write(f"### Pair {i}: {intel.pair}\n")
+            buf.write(intel.to_summary())
+        return buf.getvalue()
 
     def _parse_batch_response(
         self,
@@ -186,8 +591,22 @@ class BatchStrategist(IStrategist):
         Handles both list responses and dict responses.
         Falls back to HOLD if parsing fails for a pair.
         """
-        signals = []
+        return self._signals_for(intel_list, self._decision_map(response), risk["stop_loss_pct"])
 
+    def _signals_for(
+        self,
+        intel_list: List[MarketIntel],
+        decision_map: Dict[str, Dict],
+        stop_loss_pct: float
+    ) -> List[TradeSignal]:
+        """One signal per intel, in order; pairs without a decision are HOLD."""
+        return [
+            self._decision_to_signal(intel.pair, decision_map.get(intel.pair, {}), stop_loss_pct)
+            for intel in intel_list
+        ]
+
+    def _decision_map(self, response: any) -> Dict[str, Dict]:
+        """Decode a batch response into pair -> decision, empty if unparseable."""
         # Handle different response formats
         decisions = []
         if isinstance(response, list):
@@ -205,37 +624,20 @@ class BatchStrategist(IStrategist):
         elif isinstance(response, str):
             # Try to parse as JSON, handling code fences and extra text
             try:
-                # Strip markdown code fences if present
                 cleaned = response.strip()
-                if cleaned.startswith("```"):
-                    # Remove opening fence (```json or ```)
-                    lines = cleaned.split("\n")
-                    start_idx = 1 if lines[0].startswith("```") else 0
-                    # Find closing fence
-                    end_idx = len(lines)
-                    for i in range(len(lines) - 1, start_idx, -1):
-                        if lines[i].strip() == "```":
-                            end_idx = i
-                            break
-                    cleaned = "\n".join(lines[start_idx:end_idx])
-
-                # Find JSON array in the response
-                if "[" in cleaned:
-                    # Extract from first [ to matching ]
-                    start = cleaned.find("[")
-                    bracket_count = 0
-                    end = start
-                    for i, char in enumerate(cleaned[start:], start):
-                        if char == "[":
-                            bracket_count += 1
-                        elif char == "]":
-                            bracket_count -= 1
-                            if bracket_count == 0:
-                                end = i + 1
-                                break
-                    cleaned = cleaned[start:end]
-
-                parsed = json.loads(cleaned)
+
+                # Fast path: a bare JSON array needs no fence stripping or
+                # bracket scanning. Anything else goes through extraction.
+                parsed = None
+                if cleaned.startswith("[") and cleaned.endswith("]"):
+                    try:
+                        parsed = json.loads(cleaned)
+                    except json.JSONDecodeError:
+                        parsed = None
+
+                if parsed is None:
+                    parsed = self._extract_json(cleaned)
+
                 if isinstance(parsed, list):
                     decisions = parsed
                 elif isinstance(parsed, dict):
@@ -248,37 +650,59 @@ class BatchStrategist(IStrategist):
         for d in decisions:
             if isinstance(d, dict) and "pair" in d:
                 decision_map[d["pair"]] = d
+        return decision_map
 
-        # Create signals for each intel, matching with decisions
-        for intel in intel_list:
-            decision = decision_map.get(intel.pair, {})
-
-            try:
-                action_str = decision.get("action", "HOLD").upper()
-                action = TradeAction[action_str] if action_str in TradeAction.__members__ else TradeAction.HOLD
+    @staticmethod
+    def _decision_to_signal(pair: str, decision: Dict, stop_loss_pct: float) -> TradeSignal:
+        """Build a pair's TradeSignal from its decision, HOLD if it is malformed."""
+        try:
+            action = TRADE_ACTION_LOOKUP.get(decision.get("action", "HOLD").upper(), TradeAction.HOLD)
 
-                signal = TradeSignal(
-                    pair=intel.pair,
-                    action=action,
-                    confidence=float(decision.get("confidence", 0)),
-                    size_pct=float(decision.get("size_pct", 0)),
-                    reasoning=decision.get("reasoning", "Batch analysis"),
-                    order_type=OrderType.MARKET,
-                    stop_loss_pct=risk["stop_loss_pct"]
-                )
-            except Exception as e:
-                logger.warning(f"Failed to parse decision for {intel.pair}: {e}")
-                signal = TradeSignal(
-                    pair=intel.pair,
-                    action=TradeAction.HOLD,
-                    confidence=0.0,
-                    size_pct=0.0,
-                    reasoning=f"Parse error: {str(e)}"
-                )
+            return TradeSignal(
+                pair=pair,
+                action=action,
+                confidence=float(decision.get("confidence", 0)),
+                size_pct=float(decision.get("size_pct", 0)),
+                reasoning=decision.get("reasoning", "Batch analysis"),
+                order_type=OrderType.MARKET,
+                stop_loss_pct=stop_loss_pct
+            )
+        except Exception as e:
+            logger.warning(f"Failed to parse decision for {pair}: {e}")
+            return TradeSignal(
+                pair=pair,
+                action=TradeAction.HOLD,
+                confidence=0.0,
+                size_pct=0.0,
+                reasoning=f"Parse error: {str(e)}"
+            )
 
-            signals.append(signal)
+    @staticmethod
+    def _extract_json(cleaned: str) -> Any:
+        """Strip code fences and decode the first JSON array in the surrounding prose."""
+        # Strip markdown code fences if present
+        if cleaned.startswith("```"):
+            # Remove opening fence (```json or ```)
+            lines = cleaned.split("\n")
+            start_idx = 1 if lines[0].startswith("```") else 0
+            # Find closing fence
+            end_idx = len(lines)
+            for i in range(len(lines) - 1, start_idx, -1):
+                if lines[i].strip() == "```":
+                    end_idx = i
+                    break
+            cleaned = "\n".join(lines[start_idx:end_idx])
+
+        # Decode from each "[" in turn; raw_decode stops at the array's own
+        # closing bracket, so brackets in trailing prose are ignored
+        start = cleaned.find("[")
+        while start != -1:
+            try:
+                return _JSON_DECODER.raw_decode(cleaned, start)[0]
+            except json.JSONDecodeError:
+                start = cleaned.find("[", start + 1)
 
-        return signals
+        return json.loads(cleaned)
 
 
 class RuleBasedBatchStrategist(IStrategist):
@@ -312,25 +736,31 @@ class RuleBasedBatchStrategist(IStrategist):
             "min_confidence": self.settings.risk.min_confidence
         }
 
+        # Hoist loop-invariant lookups; each intel's fields are read once
+        max_position_pct = risk["max_position_pct"]
+        stop_loss_pct = risk["stop_loss_pct"]
+        buy, sell, hold = TradeAction.BUY, TradeAction.SELL, TradeAction.HOLD
+
         signals = []
         for intel in intel_list:
-            action = TradeAction.HOLD
+            direction = intel.fused_direction
+            fused_confidence = intel.fused_confidence
+            action = hold
             size_pct = 0.0
-            reasoning = "Rule-based batch: "
-
-            if intel.fused_direction > 0.3 and intel.fused_confidence > 0.5:
-                action = TradeAction.BUY
-                confidence = intel.fused_confidence
-                size_pct = risk["max_position_pct"] * min(1.0, abs(intel.fused_direction) + 0.2)
-                reasoning += f"Bullish ({intel.fused_direction:+.2f})"
-            elif intel.fused_direction < -0.3 and intel.fused_confidence > 0.5:
-                action = TradeAction.SELL
-                confidence = intel.fused_confidence
+
+            if direction > 0.3 and fused_confidence > 0.5:
+                action = buy
+                confidence = fused_confidence
+                size_pct = max_position_pct * min(1.0, abs(direction) + 0.2)
+                reasoning = f"Rule-based batch: Bullish ({direction:+.2f})"
+            elif direction < -0.3 and fused_confidence > 0.5:
+                action = sell
+                confidence = fused_confidence
                 size_pct = 1.0
-                reasoning += f"Bearish ({intel.fused_direction:+.2f})"
+                reasoning = f"Rule-based batch: Bearish ({direction:+.2f})"
             else:
-                confidence = intel.fused_confidence * 0.5
-                reasoning += f"No signal ({intel.fused_direction:+.2f})"
+                confidence = fused_confidence * 0.5
+                reasoning = f"Rule-based batch: No signal ({direction:+.2f})"
 
             signals.append(TradeSignal(
                 pair=intel.pair,
@@ -339,10 +769,10 @@ class RuleBasedBatchStrategist(IStrategist):
                 size_pct=size_pct,
                 reasoning=reasoning,
                 order_type=OrderType.MARKET,
-                stop_loss_pct=risk["stop_loss_pct"]
+                stop_loss_pct=stop_loss_pct
             ))
 
-        confidences = [s.confidence for s in signals if s.action != TradeAction.HOLD]
+        confidences = [s.confidence for s in signals if s.action is not hold]
         overall_confidence = sum(confidences) / len(confidences) if confidences else 0.0
 
         return TradingPlan(
@@ -0,0 +1,65 @@
+"""
+LLM Response Cache
+
+Exact-match cache for strategist LLM calls. An identical system prompt and
+prompt within the TTL reuses the previous response instead of calling Claude
+again - common in backtests, replays and fast heartbeats where analyst
+outputs quantize to the same values.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import time
+
+
+class ResponseCache:
+    """
+    Bounded in-memory TTL cache of LLM responses keyed by prompt digest.
+
+    Oldest entries are evicted first once max_entries is reached.
+    A ttl of 0 disables caching.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 128):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[bytes, Tuple[float, Any]] = {}  # key -> (expires_at, response)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(system_prompt: str, prompt: str) -> bytes:
+        """Digest of everything the LLM sees."""
+        return hashlib.blake2b((system_prompt + prompt).encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached response for this key, if still fresh."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, response = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return response
+
+    def set(self, key: bytes, response: Any) -> None:
+        """Store a response, evicting the oldest entry when full."""
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        if len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
@@ -10,13 +10,19 @@ Expected cost reduction: 80-90%
 - From ~$12/month to ~$1-2/month for small portfolios
 """
 
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import asyncio
 import logging
 import hashlib
+import heapq
+import struct
 import time
 
 from core.interfaces import IStrategist, ILLM
-from core.models import MarketIntel, Portfolio, TradingPlan, TradeSignal, TradeAction
+from core.models import MarketIntel, Portfolio, Regime, TradingPlan, TradeSignal, TradeAction
 from core.config import Settings, get_settings, CostOptimizationConfig
 
 from .simple import SimpleStrategist, RuleBasedStrategist
@@ -25,16 +31,45 @@ from .hybrid import HybridStrategist
 
 logger = logging.getLogger(__name__)
 
+# Fixed binary layout of the intel cache key: direction and confidence in
+# hundredths (the 2dp buckets decisions are reused across) plus regime id
+_INTEL_KEY = struct.Struct("<hhB")
+_REGIME_IDS = {regime: i for i, regime in enumerate(Regime)}
+
+
+@lru_cache(maxsize=4096)
+def _intel_key_hash(direction_q: int, confidence_q: int, regime_id: int) -> str:
+    """Hash a quantized intel key; buckets recur across pairs and cycles."""
+    return hashlib.blake2b(
+        _INTEL_KEY.pack(direction_q, confidence_q, regime_id), digest_size=6
+    ).hexdigest()
+
+
+def _freeze(params: Optional[Dict]) -> Tuple:
+    """Freeze a params dict into a hashable, order-independent tuple."""
+    return tuple(sorted(params.items())) if params else ()
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached decision with the price it was made at."""
+    decision: Dict
+    price: float
+    expires_at: int  # monotonic ms
+
 
 class InMemoryDecisionCache:
     """
-    Simple in-memory decision cache with TTL.
+    Simple in-memory LRU decision cache with TTL.
     Drop-in replacement for RedisCache decision methods when Redis is unavailable.
     """
 
     def __init__(self, max_entries: int = 100):
-        self._cache: Dict[str, dict] = {}  # key -> {decision, price, expires_at}
+        # key -> CacheEntry, least recently used first
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._max_entries = max_entries
+        # (expires_at, key) min-heap so expired entries are swept on write
+        self._expiry_heap: List[Tuple[int, str]] = []
 
     async def cache_decision(
         self,
@@ -44,16 +79,23 @@ class InMemoryDecisionCache:
         price_at_decision: float,
         ttl: int = 1800
     ) -> bool:
+        now = self._now_ms()
+        self._sweep(now)
+
         key = f"decision:{pair}:{intel_hash}"
-        self._cache[key] = {
-            "decision": decision,
-            "price": price_at_decision,
-            "expires_at": time.time() + ttl
-        }
-        # Evict oldest if over limit
+        expires_at = now + ttl * 1000
+        self._cache[key] = CacheEntry(decision, price_at_decision, expires_at)
+        self._cache.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        # Evict least recently used if over limit
         if len(self._cache) > self._max_entries:
-            oldest_key = min(self._cache, key=lambda k: self._cache[k]["expires_at"])
-            del self._cache[oldest_key]
+            self._cache.popitem(last=False)
+        return True
+
+    async def cache_decisions_bulk(self, entries: List[Tuple[str, str, Dict, float, int]]) -> bool:
+        """Cache several (pair, intel_hash, decision, price, ttl) entries at once."""
+        for entry in entries:
+            await self.cache_decision(*entry)
         return True
 
     async def get_cached_decision(
@@ -68,19 +110,155 @@ class InMemoryDecisionCache:
         if not entry:
             return None
         # Check expiry
-        if time.time() > entry["expires_at"]:
+        if self._now_ms() > entry.expires_at:
             del self._cache[key]
             return None
         # Check price deviation
-        cached_price = entry["price"]
+        cached_price = entry.price
         if cached_price > 0 and current_price > 0:
             deviation = abs(current_price - cached_price) / cached_price
             if deviation > max_price_deviation:
                 return None
-        return entry["decision"]
+        self._cache.move_to_end(key)
+        return entry.decision
+
+    async def get_cached_decisions_bulk(
+        self,
+        items: List[Tuple[str, str, float]],
+        max_price_deviation: float = 0.02
+    ) -> List[Optional[Dict]]:
+        """Look up several (pair, intel_hash, current_price) items in one pass."""
+        cache = self._cache
+        now = self._now_ms()
+        results: List[Optional[Dict]] = []
+
+        for pair, intel_hash, current_price in items:
+            key = f"decision:{pair}:{intel_hash}"
+            entry = cache.get(key)
+            if entry is None:
+                results.append(None)
+                continue
+            if now > entry.expires_at:
+                del cache[key]
+                results.append(None)
+                continue
+            cached_price = entry.price
+            if (cached_price > 0 and current_price > 0
+                    and abs(current_price - cached_price) > max_price_deviation * cached_price):
+                results.append(None)
+                continue
+            cache.move_to_end(key)
+            results.append(entry.decision)
+
+        return results
+
+    @staticmethod
+    def _now_ms() -> int:
+        """Monotonic clock in integer ms, immune to wall-clock steps."""
+        return time.monotonic_ns() // 1_000_000
+
+    def _sweep(self, now: int) -> None:
+        """Drop expired entries, cheapest-first off the expiry heap."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip heap records superseded by a later write of the same key
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
+
+        # Overwrites and LRU evictions leave dead heap records behind; rebuild
+        # once they outnumber live entries so the heap stays bounded
+        if len(heap) > 2 * self._max_entries:
+            self._expiry_heap = [(entry.expires_at, key) for key, entry in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
 
     def clear(self):
         self._cache.clear()
+        self._expiry_heap.clear()
+
+
+class TieredDecisionCache:
+    """
+    In-process L1 in front of a shared L2 (e.g. RedisCache) decision cache.
+
+    Reads try L1 first and only go to L2 for L1 misses; writes go to both.
+    L2 hits are not copied into L1: L2 returns only the decision, not the
+    price it was made at, and re-anchoring it at the current price would
+    let successive hits drift past max_price_deviation.
+    """
+
+    def __init__(self, l1: InMemoryDecisionCache, l2):
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    async def cache_decision(
+        self,
+        pair: str,
+        intel_hash: str,
+        decision: Dict,
+        price_at_decision: float,
+        ttl: int = 1800
+    ) -> bool:
+        await self.l1.cache_decision(pair, intel_hash, decision, price_at_decision, ttl)
+        return await self.l2.cache_decision(pair, intel_hash, decision, price_at_decision, ttl)
+
+    async def cache_decisions_bulk(self, entries: List[Tuple[str, str, Dict, float, int]]) -> bool:
+        await self.l1.cache_decisions_bulk(entries)
+        if hasattr(self.l2, "cache_decisions_bulk"):
+            return await self.l2.cache_decisions_bulk(entries)
+        results = await asyncio.gather(*(self.l2.cache_decision(*entry) for entry in entries))
+        return all(results)
+
+    async def get_cached_decision(
+        self,
+        pair: str,
+        intel_hash: str,
+        current_price: float,
+        max_price_deviation: float = 0.02
+    ) -> Optional[Dict]:
+        decision = await self.l1.get_cached_decision(pair, intel_hash, current_price, max_price_deviation)
+        if decision is not None:
+            self.l1_hits += 1
+            return decision
+        decision = await self.l2.get_cached_decision(pair, intel_hash, current_price, max_price_deviation)
+        if decision is not None:
+            self.l2_hits += 1
+        else:
+            self.misses += 1
+        return decision
+
+    async def get_cached_decisions_bulk(
+        self,
+        items: List[Tuple[str, str, float]],
+        max_price_deviation: float = 0.02
+    ) -> List[Optional[Dict]]:
+        results = await self.l1.get_cached_decisions_bulk(items, max_price_deviation)
+        missing = [i for i, decision in enumerate(results) if decision is None]
+        self.l1_hits += len(results) - len(missing)
+        if not missing:
+            return results
+
+        l2_items = [items[i] for i in missing]
+        if hasattr(self.l2, "get_cached_decisions_bulk"):
+            l2_results = await self.l2.get_cached_decisions_bulk(l2_items, max_price_deviation)
+        else:
+            l2_results = await asyncio.gather(*(
+                self.l2.get_cached_decision(*item, max_price_deviation) for item in l2_items
+            ))
+        for i, decision in zip(missing, l2_results):
+            results[i] = decision
+            if decision is not None:
+                self.l2_hits += 1
+            else:
+                self.misses += 1
+        return results
+
+    def get_tier_stats(self) -> Dict[str, int]:
+        return {"l1_hits": self.l1_hits, "l2_hits": self.l2_hits, "misses": self.misses}
 
 
 class CostOptimizedStrategist(IStrategist):
@@ -130,14 +308,24 @@ class CostOptimizedStrategist(IStrategist):
             logger.info("[COST_OPT] Using in-memory decision cache (no Redis)")
         else:
             self.cache = None
+        # Frozen risk params -> interned cache-key suffix
+        self._risk_keys: Dict[Tuple, str] = {}
 
         # Statistics
         self._total_calls = 0
         self._cache_hits = 0
+        self._coalesced_hits = 0
         self._rule_decisions = 0
         self._claude_decisions = 0
         self._batch_calls = 0
 
+        # Static part of get_stats(), built once and copied per call so callers can't mutate it
+        self._config_stats = {
+            "batch_enabled": self.config.enable_batch_analysis,
+            "hybrid_enabled": self.config.enable_hybrid_mode,
+            "cache_enabled": self.config.enable_decision_cache
+        }
+
         # Build strategist stack
         self._build_stack()
 
@@ -197,12 +385,16 @@ class CostOptimizedStrategist(IStrategist):
         self,
         intel_list: List[MarketIntel],
         portfolio: Portfolio,
-        risk_params: Dict = None
+        risk_params: Dict = None,
+        latency_budget_ms: Optional[float] = None
     ) -> TradingPlan:
         """
         Create trading plan for multiple pairs with maximum cost optimization.
 
         This is the most efficient entry point - batches all pairs together.
+        With allow_deferred_batch enabled, a caller that can wait
+        latency_budget_ms lets the batch go through the Message Batches API
+        at half price; its decisions are cached like any other.
         """
         if not intel_list:
             return TradingPlan(
@@ -213,7 +405,9 @@ class CostOptimizedStrategist(IStrategist):
             )
 
         self._total_calls += 1
-        return await self._process_batch(intel_list, portfolio, risk_params)
+        if not self.config.allow_deferred_batch:
+            latency_budget_ms = None
+        return await self._process_batch(intel_list, portfolio, risk_params, latency_budget_ms)
 
     async def _process_single(
         self,
@@ -223,19 +417,22 @@ class CostOptimizedStrategist(IStrategist):
     ) -> TradingPlan:
         """Process a single pair with caching and hybrid logic."""
 
+        if not self.llm:
+            # No LLM - rules are free and deterministic, so skip the cache entirely
+            self._rule_decisions += 1
+            return await self.rule_strategist.create_plan(intel, portfolio, risk_params)
+
         # Step 1: Check cache
         if self.config.enable_decision_cache and self.cache:
-            cached = await self._get_cached_decision(intel)
+            cached, intel_hash, current_price = await self._get_cached_decision(
+                intel, self._risk_key(risk_params)
+            )
             if cached:
                 self._cache_hits += 1
                 return cached
 
         # Step 2: Make decision
-        if not self.llm:
-            # No LLM - use rules
-            self._rule_decisions += 1
-            plan = await self.rule_strategist.create_plan(intel, portfolio, risk_params)
-        elif self.hybrid_strategist:
+        if self.hybrid_strategist:
             # Use hybrid (decides rules vs Claude)
             plan = await self.hybrid_strategist.create_plan(intel, portfolio, risk_params)
             # Track stats from hybrid
@@ -250,7 +447,7 @@ class CostOptimizedStrategist(IStrategist):
 
         # Step 3: Cache decision
         if self.config.enable_decision_cache and self.cache:
-            await self._cache_decision(intel, plan)
+            await self._cache_decision(intel, plan, intel_hash, current_price)
 
         return plan
 
@@ -258,66 +455,82 @@ class CostOptimizedStrategist(IStrategist):
         self,
         intel_list: List[MarketIntel],
         portfolio: Portfolio,
-        risk_params: Dict = None
+        risk_params: Dict = None,
+        latency_budget_ms: Optional[float] = None
     ) -> TradingPlan:
         """Process multiple pairs with batching and hybrid logic."""
 
+        if not self.llm:
+            # Rules only - nothing worth caching
+            self._rule_decisions += len(intel_list)
+            plan = await self.rule_batch_strategist.create_batch_plan(intel_list, portfolio, risk_params)
+            return TradingPlan(
+                signals=plan.signals,
+                strategy_name="cost_optimized_batch",
+                regime="mixed",
+                overall_confidence=plan.overall_confidence,
+                reasoning=f"Processed {len(intel_list)} pairs (cache: 0, new: {len(plan.signals)})"
+            )
+
         # Separate cached and uncached
         cached_signals = []
         uncached_intel = []
+        uncached_keys: Dict[str, Tuple[str, float]] = {}  # pair -> (intel_hash, price), reused on write-back
 
         if self.config.enable_decision_cache and self.cache:
-            for intel in intel_list:
-                cached = await self._get_cached_decision(intel)
+            lookups, keys = await self._get_cached_decisions(intel_list, self._risk_key(risk_params))
+            for intel, cached, key in zip(intel_list, lookups, keys):
                 if cached:
                     self._cache_hits += 1
                     cached_signals.extend(cached.signals)
                 else:
                     uncached_intel.append(intel)
+                    uncached_keys[intel.pair] = key
         else:
             uncached_intel = intel_list
 
         # Process uncached
         new_signals = []
         if uncached_intel:
-            if not self.llm:
-                # Rules only
-                self._rule_decisions += len(uncached_intel)
-                plan = await self.rule_batch_strategist.create_batch_plan(
-                    uncached_intel, portfolio, risk_params
-                )
-                new_signals = plan.signals
-            elif self.config.enable_hybrid_mode and self.hybrid_strategist:
+            # Pairs with matching intel are decided once and fanned out
+            representatives, duplicates = self._coalesce_intel(uncached_intel, portfolio)
+
+            if self.config.enable_hybrid_mode and self.hybrid_strategist:
                 # Hybrid batch
                 plan = await self.hybrid_strategist.create_batch_plan(
-                    uncached_intel, portfolio, risk_params
+                    representatives, portfolio, risk_params, latency_budget_ms
                 )
                 new_signals = plan.signals
                 # Stats tracked by hybrid
             elif self.config.enable_batch_analysis and self.batch_strategist:
-                # Batch LLM call
-                self._batch_calls += 1
-                self._claude_decisions += 1  # One call for all
+                # Batch LLM call, sharded by max_pairs_per_batch
+                shards = -(-len(representatives) // self.config.max_pairs_per_batch)
+                self._batch_calls += shards
+                self._claude_decisions += shards  # One call per shard
                 plan = await self.batch_strategist.create_batch_plan(
-                    uncached_intel, portfolio, risk_params
+                    representatives, portfolio, risk_params, latency_budget_ms
                 )
                 new_signals = plan.signals
             else:
-                # Individual LLM calls (fallback)
-                for intel in uncached_intel:
-                    self._claude_decisions += 1
-                    p = await self.llm_strategist.create_plan(intel, portfolio, risk_params)
+                # Individual LLM calls (fallback), in flight together
+                self._claude_decisions += len(representatives)
+                plans = await self.llm_strategist.create_plans(
+                    representatives, portfolio, risk_params,
+                    max_concurrency=self.config.max_concurrent_llm_calls
+                )
+                for p in plans:
                     new_signals.extend(p.signals)
 
+            if duplicates:
+                new_signals = self._fan_out(new_signals, duplicates, uncached_intel)
+
             # Cache new decisions
             if self.config.enable_decision_cache and self.cache:
-                for i, intel in enumerate(uncached_intel):
-                    if i < len(new_signals):
-                        signal_plan = TradingPlan(
-                            signals=[new_signals[i]],
-                            strategy_name="cached"
-                        )
-                        await self._cache_decision(intel, signal_plan)
+                signals_by_pair = {signal.pair: signal for signal in new_signals}
+                await self._cache_decisions([
+                    (intel, signals_by_pair[intel.pair], *uncached_keys[intel.pair])
+                    for intel in uncached_intel if intel.pair in signals_by_pair
+                ])
 
         # Combine all signals
         all_signals = cached_signals + new_signals
@@ -334,13 +547,72 @@ class CostOptimizedStrategist(IStrategist):
             reasoning=f"Processed {len(intel_list)} pairs (cache: {len(cached_signals)}, new: {len(new_signals)})"
         )
 
-    async def _get_cached_decision(self, intel: MarketIntel) -> Optional[TradingPlan]:
-        """Check cache for existing decision."""
-        if not self.cache:
-            return None
+    def _coalesce_intel(
+        self,
+        intel_list: List[MarketIntel],
+        portfolio: Portfolio
+    ) -> Tuple[List[MarketIntel], Dict[str, List[MarketIntel]]]:
+        """
+        Collapse intel that would get the same decision.
 
-        intel_hash = self._hash_intel(intel)
+        Pairs share a bucket when their intel hashes match and they agree on
+        whether the base asset is already held (the one pair-specific input
+        the rules look at).
+
+        Returns:
+            (representatives, representative pair -> duplicate intel)
+        """
+        representatives = []
+        duplicates: Dict[str, List[MarketIntel]] = {}
+        buckets: Dict[Tuple[str, bool], MarketIntel] = {}
+
+        for intel in intel_list:
+            position = portfolio.positions.get(intel.base_asset)
+            key = (self._hash_intel(intel), bool(position and position.amount > 0))
+            representative = buckets.get(key)
+            if representative is None:
+                buckets[key] = intel
+                representatives.append(intel)
+            else:
+                duplicates.setdefault(representative.pair, []).append(intel)
+
+        if duplicates:
+            coalesced = len(intel_list) - len(representatives)
+            self._coalesced_hits += coalesced
+            logger.info(f"[COST_OPT] Coalesced {coalesced} duplicate pairs into "
+                        f"{len(representatives)} decisions")
+
+        return representatives, duplicates
+
+    def _fan_out(
+        self,
+        signals: List[TradeSignal],
+        duplicates: Dict[str, List[MarketIntel]],
+        intel_list: List[MarketIntel]
+    ) -> List[TradeSignal]:
+        """Copy each representative's signal to its duplicates, in input order."""
+        signals_by_pair = {signal.pair: signal for signal in signals}
+        for signal in signals:
+            for intel in duplicates.get(signal.pair, ()):
+                signals_by_pair[intel.pair] = replace(signal, pair=intel.pair)
+
+        return [signals_by_pair[intel.pair] for intel in intel_list if intel.pair in signals_by_pair]
+
+    async def _get_cached_decision(
+        self,
+        intel: MarketIntel,
+        risk_key: str = ""
+    ) -> Tuple[Optional[TradingPlan], str, float]:
+        """
+        Check cache for existing decision.
+
+        Returns (plan or None, intel_hash, current_price); the hash and price
+        are handed back so a miss can be written back without recomputing them.
+        """
+        intel_hash = self._hash_intel(intel) + risk_key
         current_price = self._get_price_from_intel(intel)
+        if not self.cache:
+            return None, intel_hash, current_price
 
         cached = await self.cache.get_cached_decision(
             pair=intel.pair,
@@ -349,99 +621,216 @@ class CostOptimizedStrategist(IStrategist):
             max_price_deviation=self.config.cache_price_deviation
         )
 
-        if cached:
-            # Convert cached dict back to TradingPlan
-            try:
-                signal = TradeSignal(
-                    pair=intel.pair,
-                    action=TradeAction[cached.get("action", "HOLD")],
-                    confidence=cached.get("confidence", 0),
-                    size_pct=cached.get("size_pct", 0),
-                    reasoning=f"[CACHED] {cached.get('reasoning', '')}"
-                )
-                return TradingPlan(
-                    signals=[signal],
-                    strategy_name="cached",
-                    overall_confidence=signal.confidence,
-                    reasoning="Decision from cache"
-                )
-            except Exception as e:
-                logger.warning(f"[COST_OPT] Failed to restore cached decision: {e}")
-                return None
+        return self._restore_cached(intel, cached), intel_hash, current_price
 
-        return None
+    async def _get_cached_decisions(
+        self,
+        intel_list: List[MarketIntel],
+        risk_key: str = ""
+    ) -> Tuple[List[Optional[TradingPlan]], List[Tuple[str, float]]]:
+        """
+        Check the cache for every pair, in one bulk lookup if the cache supports it.
+
+        Returns the plans (None on miss) and each pair's (intel_hash, current_price).
+        """
+        if not hasattr(self.cache, "get_cached_decisions_bulk"):
+            # Look every pair up concurrently (one round-trip of latency on Redis)
+            results = await asyncio.gather(
+                *(self._get_cached_decision(intel, risk_key) for intel in intel_list)
+            )
+            return [plan for plan, _, _ in results], [(h, price) for _, h, price in results]
+
+        keys = [
+            (self._hash_intel(intel) + risk_key, self._get_price_from_intel(intel))
+            for intel in intel_list
+        ]
+        cached = await self.cache.get_cached_decisions_bulk(
+            [(intel.pair, intel_hash, price) for intel, (intel_hash, price) in zip(intel_list, keys)],
+            max_price_deviation=self.config.cache_price_deviation
+        )
+        return [self._restore_cached(intel, decision) for intel, decision in zip(intel_list, cached)], keys
+
+    def _restore_cached(self, intel: MarketIntel, cached: Optional[Dict]) -> Optional[TradingPlan]:
+        """
+        Convert a cached decision dict back to a TradingPlan.
+
+        A fresh plan is built on every hit rather than handing out a stored
+        instance: sentinels approve, reject and resize signals in place, so a
+        shared plan would leak one cycle's verdicts into the next. Rebuilding
+        costs about the same as copying a prebuilt signal.
+        """
+        if not cached:
+            return None
+
+        try:
+            signal = TradeSignal(
+                pair=intel.pair,
+                action=TradeAction[cached.get("action", "HOLD")],
+                confidence=cached.get("confidence", 0),
+                size_pct=cached.get("size_pct", 0),
+                reasoning=f"[CACHED] {cached.get('reasoning', '')}"
+            )
+            return TradingPlan(
+                signals=[signal],
+                strategy_name="cached",
+                overall_confidence=signal.confidence,
+                reasoning="Decision from cache"
+            )
+        except Exception as e:
+            logger.warning(f"[COST_OPT] Failed to restore cached decision: {e}")
+            return None
 
-    async def _cache_decision(self, intel: MarketIntel, plan: TradingPlan):
-        """Cache a decision for future reuse."""
+    async def _cache_decision(
+        self,
+        intel: MarketIntel,
+        plan: TradingPlan,
+        intel_hash: Optional[str] = None,
+        current_price: Optional[float] = None
+    ):
+        """Cache a decision for future reuse (hash and price reused if given)."""
         if not self.cache or not plan.signals:
             return
 
-        intel_hash = self._hash_intel(intel)
-        current_price = self._get_price_from_intel(intel)
-        signal = plan.signals[0]
+        await self.cache.cache_decision(
+            *self._decision_entry(intel, plan.signals[0], intel_hash, current_price)
+        )
 
+    async def _cache_decisions(self, decisions: List[Tuple[MarketIntel, TradeSignal, str, float]]):
+        """
+        Cache a batch of (intel, signal, intel_hash, current_price) decisions,
+        in one round-trip if the cache supports it.
+        """
+        if not self.cache or not decisions:
+            return
+
+        entries = [self._decision_entry(*decision) for decision in decisions]
+        if hasattr(self.cache, "cache_decisions_bulk"):
+            await self.cache.cache_decisions_bulk(entries)
+        else:
+            await asyncio.gather(*(self.cache.cache_decision(*entry) for entry in entries))
+
+    def _decision_entry(
+        self,
+        intel: MarketIntel,
+        signal: TradeSignal,
+        intel_hash: Optional[str] = None,
+        current_price: Optional[float] = None
+    ) -> Tuple[str, str, Dict, float, int]:
+        """Build the (pair, intel_hash, decision, price, ttl) cache entry for a signal."""
         decision = {
             "action": signal.action.value,
             "confidence": signal.confidence,
             "size_pct": signal.size_pct,
             "reasoning": signal.reasoning
         }
-
-        await self.cache.cache_decision(
-            pair=intel.pair,
-            intel_hash=intel_hash,
-            decision=decision,
-            price_at_decision=current_price,
-            ttl=self.config.cache_ttl_seconds
+        return (
+            intel.pair,
+            intel_hash if intel_hash is not None else self._hash_intel(intel),
+            decision,
+            current_price if current_price is not None else self._get_price_from_intel(intel),
+            self.config.cache_ttl_seconds
         )
 
     def _hash_intel(self, intel: MarketIntel) -> str:
-        """Create hash of market intel for cache key."""
+        """
+        Create hash of market intel for cache key.
+
+        Memoized on the intel instance, so the read and write-back paths and
+        repeated lookups hash it once; recomputed if the hashed fields change.
+        """
         # Hash key factors that would change the decision
-        key_data = f"{intel.fused_direction:.2f}:{intel.fused_confidence:.2f}:{intel.regime.value}"
-        return hashlib.md5(key_data.encode()).hexdigest()[:12]
+        state = (intel.fused_direction, intel.fused_confidence, intel.regime)
+        cached = intel.__dict__.get("_cache_key")
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        intel_hash = _intel_key_hash(
+            round(intel.fused_direction * 100),
+            round(intel.fused_confidence * 100),
+            _REGIME_IDS[intel.regime]
+        )
+        intel.__dict__["_cache_key"] = (state, intel_hash)
+        return intel_hash
+
+    def _risk_key(self, risk_params: Optional[Dict]) -> str:
+        """
+        Short cache-key suffix for the risk params a decision was made under.
+
+        Sizing depends on risk params, so decisions made under different ones
+        must not share a cache entry. Params only change on config reload, so
+        each frozen set is digested once and interned.
+        """
+        if not risk_params:
+            return ""
+        frozen = _freeze(risk_params)
+        try:
+            return self._risk_keys[frozen]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable values: digest without interning
+            return ":" + hashlib.blake2b(repr(frozen).encode(), digest_size=4).hexdigest()
+
+        if len(self._risk_keys) >= 32:
+            self._risk_keys.clear()
+        risk_key = ":" + hashlib.blake2b(repr(frozen).encode(), digest_size=4).hexdigest()
+        self._risk_keys[frozen] = risk_key
+        return risk_key
 
     def _get_price_from_intel(self, intel: MarketIntel) -> float:
         """Extract current price from intel."""
-        # Try to get price from signal metadata
-        if intel.signals:
-            for signal in intel.signals:
-                if hasattr(signal, 'metadata') and signal.metadata:
-                    price = signal.metadata.get('price', 0)
-                    if price > 0:
-                        return price
+        if intel.price > 0:
+            return intel.price
+
+        # Producers that don't set intel.price yet: fall back to signal metadata
+        for signal in intel.signals:
+            try:
+                price = signal.metadata.get('price', 0)
+            except AttributeError:
+                continue
+            if price > 0:
+                return price
         return 0.0
 
-    def get_stats(self) -> dict:
-        """Get cost optimization statistics."""
-        total_saved = self._cache_hits + self._rule_decisions
+    def get_stats(self, include_hybrid: bool = True) -> dict:
+        """
+        Get cost optimization statistics.
+
+        Pollers that only need the counters can pass include_hybrid=False to
+        skip building the nested hybrid stats.
+        """
+        total_saved = self._cache_hits + self._coalesced_hits + self._rule_decisions
         cost_per_call = 0.002  # Estimated
 
         stats = {
             "total_calls": self._total_calls,
             "cache_hits": self._cache_hits,
+            "coalesced_hits": self._coalesced_hits,
             "rule_decisions": self._rule_decisions,
             "claude_decisions": self._claude_decisions,
             "batch_calls": self._batch_calls,
             "savings_pct": f"{total_saved / self._total_calls * 100:.1f}%" if self._total_calls > 0 else "0%",
             "estimated_savings": f"${total_saved * cost_per_call:.2f}",
-            "config": {
-                "batch_enabled": self.config.enable_batch_analysis,
-                "hybrid_enabled": self.config.enable_hybrid_mode,
-                "cache_enabled": self.config.enable_decision_cache
-            }
+            "config": dict(self._config_stats)
         }
 
+        if isinstance(self.cache, TieredDecisionCache):
+            stats["cache_tiers"] = self.cache.get_tier_stats()
+
         # Add hybrid stats if available
-        if self.hybrid_strategist:
+        if include_hybrid and self.hybrid_strategist:
             stats["hybrid"] = self.hybrid_strategist.get_stats()
 
+        if self.llm_strategist is not None and self.llm_strategist.distiller is not None:
+            stats["distiller"] = self.llm_strategist.distiller.get_stats()
+
         return stats
 
     def reset_stats(self):
         """Reset statistics."""
         self._total_calls = 0
         self._cache_hits = 0
+        self._coalesced_hits = 0
         self._rule_decisions = 0
         self._claude_decisions = 0
         self._batch_calls = 0
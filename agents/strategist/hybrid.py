@@ -9,19 +9,25 @@ Cost savings: 30-70% depending on market conditions.
 - Volatile markets with mixed signals = lower savings
 """
 
-from typing import Dict, Optional, List
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, List, Tuple
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 
 from core.interfaces import IStrategist, ILLM
 from core.models import MarketIntel, Portfolio, TradingPlan, TradeSignal, TradeAction
 from core.config import Settings, get_settings, HybridThresholds
+from .batch import BatchStrategist
 from .simple import RuleBasedStrategist
 
 logger = logging.getLogger(__name__)
 
+_CLEAR_REASON = "Signal is clear (direction, confidence, agreement all pass thresholds)"
 
-@dataclass
+
+@dataclass(slots=True)
 class HybridStats:
     """Statistics for hybrid strategist usage."""
     total_decisions: int = 0
@@ -46,6 +52,40 @@ class HybridStats:
         }
 
 
+class BatchSizeController:
+    """
+    Hill-climbs the Claude batch size toward the best observed pairs/second.
+
+    Each tick reports the mean latency of its full-size batches; if throughput
+    dropped since the last report the search direction reverses. The size
+    stays within [min_size, max_size].
+    """
+
+    def __init__(self, max_size: int, min_size: int = 2, window: int = 50):
+        self.max_size = max(1, max_size)
+        self.min_size = min(min_size, self.max_size)
+        self.target = self.max_size
+        self.samples: Deque[Tuple[int, float]] = deque(maxlen=window)  # (batch_size, seconds)
+        self._direction = -1
+        self._last_rate: Optional[float] = None
+
+    def record(self, batch_size: int, seconds: float) -> None:
+        self.samples.append((batch_size, seconds))
+        rate = batch_size / seconds if seconds > 0 else float("inf")
+        if self._last_rate is not None and rate < self._last_rate:
+            self._direction = -self._direction
+        self._last_rate = rate
+        self.target = min(self.max_size, max(self.min_size, self.target + self._direction))
+
+    def latency_percentiles(self) -> Tuple[float, float]:
+        """(p50, p95) batch latency in seconds over the window."""
+        if not self.samples:
+            return 0.0, 0.0
+        latencies = sorted(seconds for _, seconds in self.samples)
+        last = len(latencies) - 1
+        return latencies[last // 2], latencies[round(last * 0.95)]
+
+
 class HybridStrategist(IStrategist):
     """
     Cost-optimized strategist that uses rules for clear signals
@@ -84,6 +124,23 @@ class HybridStrategist(IStrategist):
         self.thresholds = thresholds or self.settings.cost_optimization.hybrid
         self.cost_per_call = cost_per_claude_call
 
+        # Bounds parallel per-pair calls when the LLM strategist can't batch
+        self._llm_semaphore = asyncio.Semaphore(
+            max(1, self.settings.cost_optimization.max_concurrent_llm_calls)
+        )
+
+        # Sizes Claude batches from measured latency, when enabled
+        self._batch_sizer: Optional[BatchSizeController] = (
+            BatchSizeController(self.settings.cost_optimization.max_pairs_per_batch)
+            if self.settings.cost_optimization.adaptive_batch_size else None
+        )
+
+        # Built on first use when uncertain pairs can be row-marshaled into one prompt
+        self._marshal_strategist: Optional[BatchStrategist] = None
+
+        # Bumped whenever thresholds change, invalidating memoized assessments
+        self._thresholds_version = 0
+
         # Statistics
         self.stats = HybridStats()
 
@@ -99,38 +156,64 @@ class HybridStrategist(IStrategist):
         A clear signal means we can confidently use rules without
         needing Claude's more nuanced analysis.
         """
-        direction_clear = abs(intel.fused_direction) >= self.thresholds.direction_clear
-        confidence_clear = intel.fused_confidence >= self.thresholds.confidence_clear
-
-        # Check disagreement if available
-        disagreement_ok = True
-        if hasattr(intel, 'disagreement') and intel.disagreement is not None:
-            disagreement_ok = intel.disagreement <= self.thresholds.disagreement_max
-
-        is_clear = direction_clear and confidence_clear and disagreement_ok
-        logger.debug(f"[HYBRID] {intel.pair}: |dir|={abs(intel.fused_direction):.3f} vs {self.thresholds.direction_clear}, "
-                    f"conf={intel.fused_confidence:.3f} vs {self.thresholds.confidence_clear}, "
-                    f"clear={is_clear}")
+        is_clear, _ = self._assess(intel)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[HYBRID] {intel.pair}: |dir|={abs(intel.fused_direction):.3f} vs {self.thresholds.direction_clear}, "
+                        f"conf={intel.fused_confidence:.3f} vs {self.thresholds.confidence_clear}, "
+                        f"clear={is_clear}")
         return is_clear
 
     def get_signal_clarity_reason(self, intel: MarketIntel) -> str:
         """Get human-readable reason for signal clarity assessment."""
-        reasons = []
-
-        if abs(intel.fused_direction) < self.thresholds.direction_clear:
-            reasons.append(f"direction {intel.fused_direction:+.2f} below threshold {self.thresholds.direction_clear}")
+        return self._assess(intel)[1]
 
-        if intel.fused_confidence < self.thresholds.confidence_clear:
-            reasons.append(f"confidence {intel.fused_confidence:.0%} below threshold {self.thresholds.confidence_clear:.0%}")
+    def _assess(self, intel: MarketIntel) -> Tuple[bool, str]:
+        """
+        Evaluate every clarity criterion once, returning (is_clear, reason).
 
-        if hasattr(intel, 'disagreement') and intel.disagreement is not None:
-            if intel.disagreement > self.thresholds.disagreement_max:
-                reasons.append(f"disagreement {intel.disagreement:.0%} above threshold {self.thresholds.disagreement_max:.0%}")
+        Memoized on the intel instance against this strategist's thresholds
+        version, so repeat assessments of the same snapshot are a dict probe.
+        """
+        direction = intel.fused_direction
+        confidence = intel.fused_confidence
+        disagreement = intel.disagreement
+        key = (id(self), self._thresholds_version, direction, confidence, disagreement)
+        cached = intel.__dict__.get("_clarity")
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        result = self._evaluate(direction, confidence, disagreement)
+        intel.__dict__["_clarity"] = (key, result)
+        return result
+
+    def _evaluate(
+        self,
+        direction: float,
+        confidence: float,
+        disagreement: Optional[float]
+    ) -> Tuple[bool, str]:
+        """Check the clarity criteria against the current thresholds."""
+        direction_clear = self.thresholds.direction_clear
+        confidence_clear = self.thresholds.confidence_clear
+        disagreement_max = self.thresholds.disagreement_max
+
+        direction_ok = abs(direction) >= direction_clear
+        confidence_ok = confidence >= confidence_clear
+        disagreement_ok = disagreement is None or disagreement <= disagreement_max
+
+        # Clear signals (the common case for rules) need no formatting
+        if direction_ok and confidence_ok and disagreement_ok:
+            return True, _CLEAR_REASON
 
-        if not reasons:
-            return "Signal is clear (direction, confidence, agreement all pass thresholds)"
+        reasons = []
+        if not direction_ok:
+            reasons.append(f"direction {direction:+.2f} below threshold {direction_clear}")
+        if not confidence_ok:
+            reasons.append(f"confidence {confidence:.0%} below threshold {confidence_clear:.0%}")
+        if not disagreement_ok:
+            reasons.append(f"disagreement {disagreement:.0%} above threshold {disagreement_max:.0%}")
 
-        return "Uncertain: " + "; ".join(reasons)
+        return False, "Uncertain: " + "; ".join(reasons)
 
     async def create_plan(
         self,
@@ -152,8 +235,7 @@ class HybridStrategist(IStrategist):
         self.stats.total_decisions += 1
 
         # Assess signal clarity
-        is_clear = self.is_clear_signal(intel)
-        clarity_reason = self.get_signal_clarity_reason(intel)
+        is_clear, clarity_reason = self._assess(intel)
 
         if is_clear:
             # Use rule-based (free)
@@ -183,13 +265,15 @@ class HybridStrategist(IStrategist):
         self,
         intel_list: List[MarketIntel],
         portfolio: Portfolio,
-        risk_params: Dict = None
+        risk_params: Dict = None,
+        latency_budget_ms: Optional[float] = None
     ) -> TradingPlan:
         """
         Process multiple pairs with hybrid routing.
 
         Splits pairs into clear (rules) and uncertain (Claude batch).
-        Only sends uncertain pairs to Claude.
+        Only sends uncertain pairs to Claude. latency_budget_ms is passed on
+        to a batch LLM strategist, which may defer to the Message Batches API.
         """
         if not intel_list:
             return TradingPlan(
@@ -200,51 +284,23 @@ class HybridStrategist(IStrategist):
             )
 
         # Separate clear and uncertain signals
-        clear_intel = []
-        uncertain_intel = []
-
-        for intel in intel_list:
-            if self.is_clear_signal(intel):
-                clear_intel.append(intel)
-                self.stats.rule_based_decisions += 1
-                self.stats.cost_savings_estimate += self.cost_per_call
-            else:
-                uncertain_intel.append(intel)
-                self.stats.claude_decisions += 1
+        clear_intel, uncertain_intel = self.partition_by_clarity(intel_list)
 
+        self.stats.rule_based_decisions += len(clear_intel)
+        self.stats.cost_savings_estimate += self.cost_per_call * len(clear_intel)
+        self.stats.claude_decisions += len(uncertain_intel)
         self.stats.total_decisions += len(intel_list)
 
-        all_signals = []
-
-        # Process clear signals with rules (free)
-        if clear_intel:
-            logger.info(f"[HYBRID_BATCH] Processing {len(clear_intel)} pairs with RULES")
-            for intel in clear_intel:
-                plan = await self.rule_strategist.create_plan(intel, portfolio, risk_params)
-                for signal in plan.signals:
-                    signal.reasoning = f"[RULE-BASED] {signal.reasoning}"
-                all_signals.extend(plan.signals)
-
-        # Process uncertain signals with Claude batch (if batch strategist available)
-        if uncertain_intel:
-            logger.info(f"[HYBRID_BATCH] Processing {len(uncertain_intel)} pairs with CLAUDE")
-
-            # Check if LLM strategist supports batch
-            if hasattr(self.llm_strategist, 'create_batch_plan'):
-                plan = await self.llm_strategist.create_batch_plan(
-                    uncertain_intel, portfolio, risk_params
-                )
-            else:
-                # Fall back to individual calls
-                signals = []
-                for intel in uncertain_intel:
-                    p = await self.llm_strategist.create_plan(intel, portfolio, risk_params)
-                    signals.extend(p.signals)
-                plan = TradingPlan(signals=signals, strategy_name="hybrid")
+        # Rules (free) and Claude (paid) partitions run concurrently
+        rule_signals, claude_signals = await asyncio.gather(
+            self._rule_batch_signals(clear_intel, portfolio, risk_params),
+            self._claude_batch_signals(uncertain_intel, portfolio, risk_params, latency_budget_ms)
+        )
 
-            for signal in plan.signals:
-                signal.reasoning = f"[CLAUDE] {signal.reasoning}"
-            all_signals.extend(plan.signals)
+        # Merge back into input order so callers can line signals up with intel
+        signals_by_pair = {signal.pair: signal for signal in rule_signals}
+        signals_by_pair.update((signal.pair, signal) for signal in claude_signals)
+        all_signals = [signals_by_pair[intel.pair] for intel in intel_list if intel.pair in signals_by_pair]
 
         # Calculate overall confidence
         active_signals = [s for s in all_signals if s.action != TradeAction.HOLD]
@@ -261,9 +317,226 @@ class HybridStrategist(IStrategist):
             reasoning=f"Hybrid: {len(clear_intel)} rules, {len(uncertain_intel)} Claude"
         )
 
+    def partition_by_clarity(
+        self,
+        intel_list: List[MarketIntel]
+    ) -> Tuple[List[MarketIntel], List[MarketIntel]]:
+        """Split intel into (clear, uncertain), preserving input order."""
+        # Same criteria as _assess, without building reason strings
+        direction_clear = self.thresholds.direction_clear
+        confidence_clear = self.thresholds.confidence_clear
+        disagreement_max = self.thresholds.disagreement_max
+
+        clear_intel = []
+        uncertain_intel = []
+        for intel in intel_list:
+            disagreement = intel.disagreement
+            if (abs(intel.fused_direction) >= direction_clear
+                    and intel.fused_confidence >= confidence_clear
+                    and (disagreement is None or disagreement <= disagreement_max)):
+                clear_intel.append(intel)
+            else:
+                uncertain_intel.append(intel)
+        return clear_intel, uncertain_intel
+
+    async def _rule_batch_signals(
+        self,
+        clear_intel: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None
+    ) -> List[TradeSignal]:
+        """Decide clear signals with rules (free)."""
+        if not clear_intel:
+            return []
+
+        logger.info(f"[HYBRID_BATCH] Processing {len(clear_intel)} pairs with RULES")
+        if hasattr(self.rule_strategist, 'decide_batch_sync'):
+            # Pure CPU work: call it directly rather than through the await chain,
+            # tagging each reasoning string as it is built instead of rebuilding it
+            return self.rule_strategist.decide_batch_sync(
+                clear_intel, portfolio, risk_params, tag="[RULE-BASED] "
+            ).signals
+
+        signals = []
+        for intel in clear_intel:
+            plan = await self.rule_strategist.create_plan(intel, portfolio, risk_params)
+            signals.extend(plan.signals)
+        for signal in signals:
+            signal.reasoning = f"[RULE-BASED] {signal.reasoning}"
+        return signals
+
+    async def _claude_batch_signals(
+        self,
+        uncertain_intel: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None,
+        latency_budget_ms: Optional[float] = None
+    ) -> List[TradeSignal]:
+        """Decide uncertain signals with Claude, batched if supported (paid)."""
+        if not uncertain_intel:
+            return []
+
+        logger.info(f"[HYBRID_BATCH] Processing {len(uncertain_intel)} pairs with CLAUDE")
+
+        # Check if LLM strategist supports batch
+        if hasattr(self.llm_strategist, 'create_batch_plan'):
+            if latency_budget_ms is not None:
+                # Deferred batches aren't latency-sensitive, so skip the sizer
+                plan = await self.llm_strategist.create_batch_plan(
+                    uncertain_intel, portfolio, risk_params, latency_budget_ms=latency_budget_ms
+                )
+                signals = plan.signals
+            else:
+                plans = await self._run_batches(
+                    self.llm_strategist.create_batch_plan, uncertain_intel, portfolio, risk_params
+                )
+                signals = [signal for plan in plans for signal in plan.signals]
+        else:
+            signals = await self._marshaled_claude_signals(uncertain_intel, portfolio, risk_params)
+            if signals is None:
+                signals = await self._concurrent_claude_signals(uncertain_intel, portfolio, risk_params)
+
+        for signal in signals:
+            signal.reasoning = f"[CLAUDE] {signal.reasoning}"
+        return signals
+
+    async def _marshaled_claude_signals(
+        self,
+        uncertain_intel: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None
+    ) -> Optional[List[TradeSignal]]:
+        """
+        Decide several uncertain pairs in one prompt through the LLM behind a
+        single-pair strategist. The shared system prompt and risk rules are
+        sent once per shard of max_pairs_per_batch pairs instead of per pair.
+
+        Returns None when marshaling isn't possible or the batch call failed,
+        so the caller can fall back to individual calls.
+        """
+        llm = getattr(self.llm_strategist, 'llm', None)
+        if (llm is None or len(uncertain_intel) < 2
+                or not self.settings.cost_optimization.enable_batch_analysis):
+            return None
+
+        if self._marshal_strategist is None:
+            self._marshal_strategist = BatchStrategist(llm, self.settings)
+
+        plans = await self._run_batches(
+            self._marshal_strategist.create_batch_plan, uncertain_intel, portfolio, risk_params
+        )
+        signals = []
+        failed_pairs = set()
+        for plan in plans:
+            if plan.strategy_name == "batch_error":
+                logger.warning(f"[HYBRID_BATCH] Marshaled call failed, falling back to per-pair calls: {plan.reasoning}")
+                failed_pairs.update(signal.pair for signal in plan.signals)
+            else:
+                signals.extend(plan.signals)
+        if failed_pairs:
+            # Only the failed shards are retried, one call per pair
+            signals.extend(await self._concurrent_claude_signals(
+                [intel for intel in uncertain_intel if intel.pair in failed_pairs], portfolio, risk_params
+            ))
+        return signals
+
+    async def _run_batches(
+        self,
+        create_batch_plan: Callable[..., Awaitable[TradingPlan]],
+        uncertain_intel: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None
+    ) -> List[TradingPlan]:
+        """
+        Run a batch strategist over the pairs. With adaptive_batch_size the
+        pairs are split into concurrent batches of the controller's target
+        size, and full-size batch latency is fed back to the controller.
+        """
+        sizer = self._batch_sizer
+        if sizer is None:
+            try:
+                return [await create_batch_plan(uncertain_intel, portfolio, risk_params)]
+            except Exception as e:
+                return [self._error_batch_plan(uncertain_intel, e)]
+
+        size = sizer.target
+        full_batch_seconds: List[float] = []
+
+        async def timed(chunk: List[MarketIntel]) -> TradingPlan:
+            started = time.monotonic()
+            plan = await create_batch_plan(chunk, portfolio, risk_params)
+            if len(chunk) == size:
+                full_batch_seconds.append(time.monotonic() - started)
+            return plan
+
+        chunks = [uncertain_intel[i:i + size] for i in range(0, len(uncertain_intel), size)]
+        plans = await asyncio.gather(*(timed(chunk) for chunk in chunks), return_exceptions=True)
+        if full_batch_seconds:
+            sizer.record(size, sum(full_batch_seconds) / len(full_batch_seconds))
+        return [
+            self._error_batch_plan(chunk, plan) if isinstance(plan, Exception) else plan
+            for chunk, plan in zip(chunks, plans)
+        ]
+
+    @staticmethod
+    def _error_signal(intel: MarketIntel, error: Exception) -> TradeSignal:
+        """HOLD for a pair whose Claude call failed, carrying the error."""
+        return TradeSignal(
+            pair=intel.pair,
+            action=TradeAction.HOLD,
+            confidence=0.0,
+            size_pct=0.0,
+            reasoning=f"Claude error: {error}"
+        )
+
+    @classmethod
+    def _error_batch_plan(cls, intel_list: List[MarketIntel], error: Exception) -> TradingPlan:
+        """Same shape as a failed BatchStrategist plan, for a batch call that raised."""
+        logger.error(f"[HYBRID_BATCH] Batch call failed for {len(intel_list)} pairs: {error}")
+        return TradingPlan(
+            signals=[cls._error_signal(intel, error) for intel in intel_list],
+            strategy_name="batch_error",
+            overall_confidence=0.0,
+            reasoning=f"Batch analysis error: {error}"
+        )
+
+    async def _concurrent_claude_signals(
+        self,
+        uncertain_intel: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None
+    ) -> List[TradeSignal]:
+        """Decide uncertain pairs with individual calls, issued concurrently."""
+        create_plans = getattr(self.llm_strategist, 'create_plans', None)
+        if create_plans is not None:
+            # Strategist shares the pair-independent prompt parts across calls
+            plans = await create_plans(uncertain_intel, portfolio, risk_params, semaphore=self._llm_semaphore)
+        else:
+            async def decide(intel: MarketIntel) -> TradingPlan:
+                async with self._llm_semaphore:
+                    return await self.llm_strategist.create_plan(intel, portfolio, risk_params)
+
+            plans = await asyncio.gather(
+                *(decide(intel) for intel in uncertain_intel), return_exceptions=True
+            )
+        signals = []
+        for intel, p in zip(uncertain_intel, plans):
+            if isinstance(p, Exception):
+                logger.error(f"[HYBRID_BATCH] {intel.pair}: Claude call failed: {p}")
+                signals.append(self._error_signal(intel, p))
+                continue
+            signals.extend(p.signals)
+        return signals
+
     def get_stats(self) -> dict:
         """Get hybrid strategist statistics."""
-        return self.stats.to_dict()
+        stats = self.stats.to_dict()
+        if self._batch_sizer is not None:
+            p50, p95 = self._batch_sizer.latency_percentiles()
+            stats["claude_batch_size"] = self._batch_sizer.target
+            stats["claude_batch_latency_p50_s"] = round(p50, 3)
+            stats["claude_batch_latency_p95_s"] = round(p95, 3)
+        return stats
 
     def reset_stats(self):
         """Reset statistics."""
@@ -274,12 +547,19 @@ class AdaptiveHybridStrategist(HybridStrategist):
     """
     Extended hybrid strategist that adapts thresholds based on performance.
 
-    Tracks win rates for rule-based vs Claude decisions and adjusts
-    thresholds to optimize the cost/accuracy tradeoff.
+    Tracks win rates for rule-based vs Claude decisions over a rolling
+    window of recent outcomes and adjusts thresholds to optimize the
+    cost/accuracy tradeoff.
     """
 
+    OUTCOME_WINDOW = 200  # Recent outcomes the win rates are computed over
+    ADAPT_EVERY = 10      # Outcomes recorded between threshold adjustments
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # (was_rule_based, was_profitable), oldest first; counters track its contents
+        self._outcomes: Deque[Tuple[bool, bool]] = deque()
+        self._since_adapt = 0
         self._rule_wins = 0
         self._rule_losses = 0
         self._claude_wins = 0
@@ -287,19 +567,28 @@ class AdaptiveHybridStrategist(HybridStrategist):
 
     def record_outcome(self, was_rule_based: bool, was_profitable: bool):
         """Record the outcome of a trade for adaptation."""
+        if len(self._outcomes) >= self.OUTCOME_WINDOW:
+            self._count_outcome(*self._outcomes.popleft(), -1)
+        self._outcomes.append((was_rule_based, was_profitable))
+        self._count_outcome(was_rule_based, was_profitable, 1)
+
+        # Adapt thresholds based on relative performance, every few outcomes
+        self._since_adapt += 1
+        if self._since_adapt >= self.ADAPT_EVERY:
+            self._since_adapt = 0
+            self._adapt_thresholds()
+
+    def _count_outcome(self, was_rule_based: bool, was_profitable: bool, delta: int):
         if was_rule_based:
             if was_profitable:
-                self._rule_wins += 1
+                self._rule_wins += delta
             else:
-                self._rule_losses += 1
+                self._rule_losses += delta
         else:
             if was_profitable:
-                self._claude_wins += 1
+                self._claude_wins += delta
             else:
-                self._claude_losses += 1
-
-        # Adapt thresholds based on relative performance
-        self._adapt_thresholds()
+                self._claude_losses += delta
 
     def _adapt_thresholds(self):
         """Adjust thresholds based on performance metrics."""
@@ -317,6 +606,7 @@ class AdaptiveHybridStrategist(HybridStrategist):
         if rule_win_rate < claude_win_rate - 0.1:
             self.thresholds.direction_clear = min(0.8, self.thresholds.direction_clear + 0.05)
             self.thresholds.confidence_clear = min(0.9, self.thresholds.confidence_clear + 0.05)
+            self._thresholds_version += 1
             logger.info(f"[ADAPTIVE] Tightened thresholds: dir={self.thresholds.direction_clear}, conf={self.thresholds.confidence_clear}")
 
         # If rules are performing as well as Claude, relax thresholds
@@ -324,6 +614,7 @@ class AdaptiveHybridStrategist(HybridStrategist):
         elif rule_win_rate >= claude_win_rate:
             self.thresholds.direction_clear = max(0.4, self.thresholds.direction_clear - 0.05)
             self.thresholds.confidence_clear = max(0.6, self.thresholds.confidence_clear - 0.05)
+            self._thresholds_version += 1
             logger.info(f"[ADAPTIVE] Relaxed thresholds: dir={self.thresholds.direction_clear}, conf={self.thresholds.confidence_clear}")
 
     def get_stats(self) -> dict:
@@ -5,25 +5,40 @@ Converts market intelligence into trading decisions using Claude.
 This is the core decision-making agent.
 """
 
-from typing import Dict, Optional
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+import asyncio
 import logging
+import string
+import time
 
 from core.interfaces import IStrategist, ILLM
 from core.models import (
     MarketIntel, Portfolio, TradingPlan, TradeSignal, 
-    TradeAction, TradeStatus, OrderType
+    TradeAction, TradeStatus, OrderType,
+    TRADE_ACTION_LOOKUP
 )
 from core.config import Settings, get_settings
+from core.ml.decision_distiller import DecisionDistiller
+from .cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Decision thresholds; STRATEGIST_SYSTEM_PROMPT is rendered from these so
+# the prompt and _forced_hold cannot drift apart
+_BUY_DIRECTION = 0.4
+_BUY_CONFIDENCE = 0.65
+_SELL_DIRECTION = -0.3
+_SELL_CONFIDENCE = 0.55
+
 
 # System prompt for Claude
-STRATEGIST_SYSTEM_PROMPT = """Crypto trading strategist. Convert analyst signals to trades.
+STRATEGIST_SYSTEM_PROMPT = f"""Crypto trading strategist. Convert analyst signals to trades.
 
 Rules:
-- BUY only when direction > +0.4 AND confidence > 0.65 AND no existing position in this pair.
-- SELL when direction < -0.3 AND confidence > 0.55.
+- BUY only when direction > {_BUY_DIRECTION:+} AND confidence > {_BUY_CONFIDENCE} AND no existing position in this pair.
+- SELL when direction < {_SELL_DIRECTION:+} AND confidence > {_SELL_CONFIDENCE}.
 - Otherwise HOLD. Be selective -- only trade when signals are strong and aligned.
 - Never recommend BUY for a pair we already hold. Prefer HOLD.
 Match confidence to signal strength. Risk management handled separately.
@@ -39,10 +54,48 @@ Current positions: {positions_summary}
 Risk: max_position={max_position_pct:.0%}, stop_loss={stop_loss_pct:.0%}, min_confidence={min_confidence:.0%}
 Strategies: TREND_FOLLOW, MEAN_REVERT, RISK_OFF
 
-IMPORTANT: Do NOT recommend BUY if we already hold a position in {pair}. Only BUY when signals are strong (direction > +0.4, confidence > 0.65).
+JSON response (reasoning max 12 words):
+{{"action":"BUY|SELL|HOLD","confidence":0.0-1.0,"size_pct":0.0-{max_position_pct},"strategy":"...","reasoning":"..."}}"""
+
+# One tool call with five short fields; reasoning is capped at 12 words
+DECISION_MAX_TOKENS = 120
+
+# Structured output schema: Claude returns the decision as tool input, so no
+# text JSON has to be parsed. The prompt keeps its JSON skeleton for the
+# Codex fallback, which ignores tools.
+TRADE_DECISION_TOOL = {
+    "name": "emit_trade_decision",
+    "description": "Record the trading decision for the analyzed pair.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "action": {"type": "string", "enum": ["BUY", "SELL", "HOLD"]},
+            "confidence": {"type": "number"},
+            "size_pct": {"type": "number"},
+            "strategy": {"type": "string"},
+            "reasoning": {"type": "string"}
+        },
+        "required": ["action", "confidence"]
+    }
+}
+
+# Per-pair fields of ANALYSIS_PROMPT, in template order. _render_prompt
+# fills them positionally, so an edited template fails here at import.
+_PROMPT_GAP = "\x00"
+if tuple(
+    field for _, field, _, _ in string.Formatter().parse(ANALYSIS_PROMPT)
+    if field in ("pair", "intel_summary")
+) != ("pair", "intel_summary"):
+    raise RuntimeError("ANALYSIS_PROMPT per-pair fields changed; update SimpleStrategist._render_prompt")
+
 
-JSON response:
-{{"action":"BUY|SELL|HOLD","confidence":0.0-1.0,"size_pct":0.0-{max_position_pct},"strategy":"...","reasoning":"brief","key_factors":["..."],"risks":["..."]}}"""
+def _settings_risk(settings: Settings) -> Mapping:
+    """Read-only risk params from settings, used when a caller passes none."""
+    return MappingProxyType({
+        "max_position_pct": settings.risk.max_position_pct,
+        "stop_loss_pct": settings.risk.stop_loss_pct,
+        "min_confidence": settings.risk.min_confidence
+    })
 
 
 class SimpleStrategist(IStrategist):
@@ -52,9 +105,38 @@ class SimpleStrategist(IStrategist):
     Simple but effective: analyze intel → Claude decision → trade signal
     """
     
-    def __init__(self, llm: ILLM, settings: Settings = None):
+    def __init__(
+        self,
+        llm: ILLM,
+        settings: Settings = None,
+        cache: Optional[ResponseCache] = None,
+        semantic_bucket: float = 0.05,
+        semantic_cache_size: int = 1024,
+        distiller: Optional[DecisionDistiller] = None
+    ):
         self.llm = llm
         self.settings = settings or get_settings()
+        self._default_risk = _settings_risk(self.settings)
+        # Identical prompts within the TTL reuse the previous decision
+        self.response_cache = cache if cache is not None else ResponseCache()
+
+        # Jittered intel (same semantic_bucket-wide direction/confidence bins,
+        # same side of every prompt threshold) within the TTL reuses it too.
+        # semantic_bucket=0 disables this.
+        self.semantic_bucket = semantic_bucket
+        self._semantic_cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._semantic_cache_size = semantic_cache_size
+        self._semantic_hits = 0
+
+        # (portfolio snapshot + risk, context) of the last _prompt_context call
+        self._context_cache: Optional[Tuple[Tuple, Dict]] = None
+
+        # Optional local model of Claude's past decisions; when it is
+        # confident about an intel bin, Claude is not called
+        cost_opt = self.settings.cost_optimization
+        if distiller is None and cost_opt.enable_decision_distiller:
+            distiller = DecisionDistiller(shadow_rate=cost_opt.distiller_shadow_rate)
+        self.distiller = distiller
     
     async def create_plan(
         self,
@@ -70,97 +152,374 @@ class SimpleStrategist(IStrategist):
             portfolio: Current portfolio state
             risk_params: Risk parameters (optional, uses settings if not provided)
         """
-        risk = risk_params or {
-            "max_position_pct": self.settings.risk.max_position_pct,
-            "stop_loss_pct": self.settings.risk.stop_loss_pct,
-            "min_confidence": self.settings.risk.min_confidence
-        }
-        
-        try:
-            # Log analyst signals before strategist processing
-            logger.debug(f"[ANALYST] {intel.pair}: direction={intel.fused_direction:+.2f}, "
-                        f"confidence={intel.fused_confidence:.0%}")
-
-            # Build positions summary for context
-            base_asset = intel.pair.split("/")[0]
-            if portfolio.positions:
-                held = [f"{s}: {p.amount:.6f}" for s, p in portfolio.positions.items() if p.amount > 0]
-                positions_summary = ", ".join(held) if held else "None"
-            else:
-                positions_summary = "None"
-
-            # Build prompt
-            prompt = ANALYSIS_PROMPT.format(
-                portfolio_summary=portfolio.to_summary(),
-                pair=intel.pair,
-                intel_summary=intel.to_summary(),
-                positions_summary=positions_summary,
-                max_position_pct=risk["max_position_pct"],
-                stop_loss_pct=risk["stop_loss_pct"],
-                min_confidence=risk["min_confidence"]
-            )
+        risk = self._resolve_risk(risk_params)
+        return await self._decide(intel, risk, self._prompt_context(portfolio, risk))
 
-            # Get Claude's decision
-            decision = await self.llm.analyze_market(
-                prompt=prompt,
-                system_prompt=STRATEGIST_SYSTEM_PROMPT,
-                max_tokens=300
-            )
+    async def create_plans(
+        self,
+        intel_list: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        max_concurrency: int = 8
+    ) -> List[TradingPlan]:
+        """
+        Create one plan per pair with concurrent Claude calls.
+
+        The portfolio and risk parts of the prompt are identical for every
+        pair, so they are built once and shared. At most max_concurrency
+        calls are in flight; pass a semaphore instead to share the bound
+        with other callers. A pair whose call fails gets an error HOLD.
+        """
+        risk = self._resolve_risk(risk_params)
+        context = self._prompt_context(portfolio, risk)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def decide(intel: MarketIntel) -> TradingPlan:
+            async with semaphore:
+                return await self._decide(intel, risk, context)
+
+        results = await asyncio.gather(
+            *(decide(intel) for intel in intel_list), return_exceptions=True
+        )
+        return [
+            self._error_plan(intel, result) if isinstance(result, BaseException) else result
+            for intel, result in zip(intel_list, results)
+        ]
+
+    async def create_plans_batch(
+        self,
+        intel_list: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None
+    ) -> List[TradingPlan]:
+        """
+        Create one plan per pair through the Message Batches API.
+
+        Every pair Claude must decide goes into a single batch, billed at
+        half the real-time rate but taking minutes to finish - for
+        scheduled heartbeats, not interactive trades. Needs
+        cost_optimization.allow_deferred_batch and an LLM with
+        analyze_market_batch; otherwise this is create_plans.
+
+        Returns plans in input order. Pairs whose batch request failed
+        get an error HOLD.
+        """
+        if not (
+            self.settings.cost_optimization.allow_deferred_batch
+            and hasattr(self.llm, "analyze_market_batch")
+        ):
+            return await self.create_plans(intel_list, portfolio, risk_params)
+
+        risk = self._resolve_risk(risk_params)
+        context = self._prompt_context(portfolio, risk)
+
+        plans: List[Optional[TradingPlan]] = [None] * len(intel_list)
+        requests = []
+        pending = {}  # custom_id -> (index, cache_key, semantic_key)
+        for i, intel in enumerate(intel_list):
+            try:
+                hold_reason = self._forced_hold(intel, context)
+                if hold_reason is not None:
+                    plans[i] = self._hold_plan(intel, risk, hold_reason)
+                    continue
+
+                decision, prompt, cache_key, semantic_key = self._cached_decision(intel, context)
+                if decision is None:
+                    decision = self._distilled(intel, context)
+                if decision is None:
+                    # custom_id only allows [a-zA-Z0-9_-], so pairs are keyed by position
+                    custom_id = f"pair-{i}"
+                    requests.append({
+                        "custom_id": custom_id,
+                        "prompt": prompt,
+                        "system_prompt": STRATEGIST_SYSTEM_PROMPT,
+                        "max_tokens": DECISION_MAX_TOKENS,
+                        "tool": TRADE_DECISION_TOOL
+                    })
+                    pending[custom_id] = (i, cache_key, semantic_key)
+                    continue
+
+                plans[i] = self._to_plan(intel, risk, decision)
+            except Exception as e:
+                plans[i] = self._error_plan(intel, e)
 
-            # Log raw Claude response
-            logger.debug(f"[CLAUDE_RAW] {intel.pair}: {decision}")
-
-            # Log analyst→strategist conversion
-            analyst_conf = intel.fused_confidence
-            strategist_conf = float(decision.get("confidence", 0))
-            strategist_action = decision.get('action', 'HOLD')
-            logger.info(f"[CONVERSION] {intel.pair}: analyst={analyst_conf:.0%} → "
-                       f"strategist {strategist_action} confidence={strategist_conf:.0%}")
-
-            logger.info(f"Strategist decision for {intel.pair}: {decision.get('action')} "
-                       f"(confidence: {decision.get('confidence', 0):.0%})")
-            
-            # Convert to TradeSignal
-            action_str = decision.get("action", "HOLD").upper()
-            action = TradeAction[action_str] if action_str in TradeAction.__members__ else TradeAction.HOLD
-            
-            signal = TradeSignal(
+        if requests:
+            try:
+                results = await self.llm.analyze_market_batch(requests)
+            except Exception as e:
+                logger.error(f"Strategist batch error: {e}")
+                results = {}
+
+            for custom_id, (i, cache_key, semantic_key) in pending.items():
+                intel = intel_list[i]
+                try:
+                    decision = results.get(custom_id)
+                    if decision is None:
+                        raise ValueError("no result in message batch")
+                    self._remember(decision, cache_key, semantic_key)
+                    self._distill(intel, context, decision)
+                    plans[i] = self._to_plan(intel, risk, decision)
+                except Exception as e:
+                    plans[i] = self._error_plan(intel, e)
+
+        return plans
+
+    @staticmethod
+    def _forced_hold(intel: MarketIntel, context: Dict) -> Optional[str]:
+        """Reason the system prompt's thresholds force a HOLD, or None if Claude must decide."""
+        direction = intel.fused_direction
+        confidence = intel.fused_confidence
+        if direction < _SELL_DIRECTION and confidence > _SELL_CONFIDENCE:
+            return None
+        if direction > _BUY_DIRECTION and confidence > _BUY_CONFIDENCE:
+            if intel.base_asset in context["held_assets"]:
+                return "Deterministic HOLD: already holding, no re-BUY"
+            return None
+        return "Deterministic HOLD: thresholds not met"
+
+    @staticmethod
+    def _hold_plan(intel: MarketIntel, risk: Dict, reasoning: str) -> TradingPlan:
+        confidence = intel.fused_confidence * 0.5
+        return TradingPlan(
+            signals=[TradeSignal(
                 pair=intel.pair,
-                action=action,
-                confidence=float(decision.get("confidence", 0)),
-                size_pct=float(decision.get("size_pct", 0)),
-                reasoning=decision.get("reasoning", ""),
+                action=TradeAction.HOLD,
+                confidence=confidence,
+                size_pct=0.0,
+                reasoning=reasoning,
                 order_type=OrderType.MARKET,
                 stop_loss_pct=risk["stop_loss_pct"]
+            )],
+            strategy_name="deterministic",
+            regime=intel.regime.value,
+            overall_confidence=confidence,
+            reasoning=reasoning
+        )
+
+    def _semantic_key(self, intel: MarketIntel, context: Dict) -> Optional[Tuple]:
+        """Bucket key for near-identical intel, or None if disabled."""
+        bucket = self.semantic_bucket
+        if bucket <= 0:
+            return None
+        direction = intel.fused_direction
+        confidence = intel.fused_confidence
+        return (
+            intel.pair,
+            intel.regime,
+            context["positions_summary"],
+            context["max_position_pct"],
+            context["stop_loss_pct"],
+            context["min_confidence"],
+            round(direction / bucket),
+            round(confidence / bucket),
+            # Bins can straddle a threshold; keep each side's decisions apart
+            direction > _BUY_DIRECTION and confidence > _BUY_CONFIDENCE,
+            direction < _SELL_DIRECTION and confidence > _SELL_CONFIDENCE
+        )
+
+    def _get_semantic(self, key: Tuple) -> Optional[Dict]:
+        entry = self._semantic_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, decision = entry
+        if time.monotonic() > expires_at:
+            del self._semantic_cache[key]
+            return None
+        self._semantic_cache.move_to_end(key)
+        self._semantic_hits += 1
+        return decision
+
+    def _set_semantic(self, key: Tuple, decision: Dict) -> None:
+        ttl = self.response_cache.ttl
+        if ttl <= 0:
+            return
+        self._semantic_cache[key] = (time.monotonic() + ttl, decision)
+        self._semantic_cache.move_to_end(key)
+        if len(self._semantic_cache) > self._semantic_cache_size:
+            self._semantic_cache.popitem(last=False)
+
+    def _resolve_risk(self, risk_params: Optional[Dict]) -> Mapping:
+        return risk_params or self._default_risk
+
+    def _prompt_context(self, portfolio: Portfolio, risk: Dict) -> Dict:
+        """
+        Prompt fields that don't depend on the pair.
+
+        Reused across per-pair create_plan calls until the portfolio
+        snapshot or risk parameters change. Callers must not mutate it.
+        """
+        state = (
+            portfolio._summary_state(),
+            risk["max_position_pct"], risk["stop_loss_pct"], risk["min_confidence"]
+        )
+        cached = self._context_cache
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        # Build positions summary for context, in one pass over the positions
+        held = [(s, p.amount) for s, p in portfolio.positions.items() if p.amount > 0]
+        held_assets = frozenset(s for s, _ in held)
+        positions_summary = ", ".join([f"{s}: {amount:.6f}" for s, amount in held]) or "None"
+
+        context = {
+            "portfolio_summary": portfolio.to_summary(),
+            "positions_summary": positions_summary,
+            "held_assets": held_assets,  # Not a prompt field; used by _forced_hold
+            "max_position_pct": risk["max_position_pct"],
+            "stop_loss_pct": risk["stop_loss_pct"],
+            "min_confidence": risk["min_confidence"]
+        }
+        # Render everything but the per-pair fields once; _render_prompt
+        # fills the gaps by concatenation
+        context["prompt_segments"] = tuple(ANALYSIS_PROMPT.format(
+            pair=_PROMPT_GAP, intel_summary=_PROMPT_GAP, **context
+        ).split(_PROMPT_GAP))
+        self._context_cache = (state, context)
+        return context
+
+    @staticmethod
+    def _render_prompt(intel: MarketIntel, context: Dict) -> str:
+        """ANALYSIS_PROMPT for one pair, from the pre-rendered segments."""
+        head, intel_label, tail = context["prompt_segments"]
+        return f"{head}{intel.pair}{intel_label}{intel.to_summary()}{tail}"
+
+    def _cached_decision(
+        self, intel: MarketIntel, context: Dict
+    ) -> Tuple[Optional[Dict], Optional[str], Optional[bytes], Optional[Tuple]]:
+        """
+        Look a pair's decision up in the semantic and exact-prompt caches.
+
+        Returns (decision, prompt, cache_key, semantic_key); decision is None
+        on a miss, and prompt/cache_key are None on a semantic hit.
+        """
+        semantic_key = self._semantic_key(intel, context)
+        decision = self._get_semantic(semantic_key) if semantic_key is not None else None
+        if decision is not None:
+            return decision, None, None, semantic_key
+
+        prompt = self._render_prompt(intel, context)
+
+        # Skip Claude on an identical recent prompt
+        cache_key = ResponseCache.key(STRATEGIST_SYSTEM_PROMPT, prompt)
+        decision = self.response_cache.get(cache_key)
+        if decision is not None and semantic_key is not None:
+            self._set_semantic(semantic_key, decision)
+        return decision, prompt, cache_key, semantic_key
+
+    def _distilled(self, intel: MarketIntel, context: Dict) -> Optional[Dict]:
+        """The distiller's decision for this intel, or None if Claude must decide."""
+        if self.distiller is None:
+            return None
+        return self.distiller.predict(
+            intel, intel.base_asset in context["held_assets"], context["max_position_pct"]
+        )
+
+    def _distill(self, intel: MarketIntel, context: Dict, decision: Dict) -> None:
+        if self.distiller is not None:
+            self.distiller.record(
+                intel, intel.base_asset in context["held_assets"], context["max_position_pct"], decision
             )
-            
-            # Create plan
-            plan = TradingPlan(
-                signals=[signal],
-                strategy_name=decision.get("strategy", "unknown"),
-                regime=intel.regime.value,
-                overall_confidence=signal.confidence,
-                reasoning=decision.get("reasoning", "")
-            )
-            
-            return plan
-            
+
+    def _remember(self, decision: Dict, cache_key: bytes, semantic_key: Optional[Tuple]) -> None:
+        self.response_cache.set(cache_key, decision)
+        if semantic_key is not None:
+            self._set_semantic(semantic_key, decision)
+
+    async def _decide(self, intel: MarketIntel, risk: Dict, context: Dict) -> TradingPlan:
+        """Ask Claude for one pair's decision, given the shared prompt context."""
+        try:
+            # Log analyst signals before strategist processing
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[ANALYST] %s: direction=%+.2f, confidence=%.0f%%",
+                             intel.pair, intel.fused_direction, intel.fused_confidence * 100)
+
+            # The prompt's rules leave Claude no choice but HOLD here
+            hold_reason = self._forced_hold(intel, context)
+            if hold_reason is not None:
+                return self._hold_plan(intel, risk, hold_reason)
+
+            decision, prompt, cache_key, semantic_key = self._cached_decision(intel, context)
+            if decision is None:
+                decision = self._distilled(intel, context)
+            if decision is None:
+                # Get Claude's decision
+                decision = await self.llm.analyze_market(
+                    prompt=prompt,
+                    system_prompt=STRATEGIST_SYSTEM_PROMPT,
+                    max_tokens=DECISION_MAX_TOKENS,
+                    tool=TRADE_DECISION_TOOL
+                )
+                self._remember(decision, cache_key, semantic_key)
+                self._distill(intel, context, decision)
+
+            return self._to_plan(intel, risk, decision)
+
         except Exception as e:
-            logger.error(f"Strategist error for {intel.pair}: {e}")
-            
-            # Return HOLD on error
-            return TradingPlan(
-                signals=[TradeSignal(
-                    pair=intel.pair,
-                    action=TradeAction.HOLD,
-                    confidence=0.0,
-                    size_pct=0.0,
-                    reasoning=f"Error: {str(e)}"
-                )],
-                strategy_name="error",
-                overall_confidence=0.0,
-                reasoning=f"Strategy error: {str(e)}"
-            )
+            return self._error_plan(intel, e)
+
+    @staticmethod
+    def _to_plan(intel: MarketIntel, risk: Dict, decision: Dict) -> TradingPlan:
+        """Convert Claude's decision for one pair into a plan."""
+        # Log raw Claude response (repr of the dict only when DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[CLAUDE_RAW] %s: %s", intel.pair, decision)
+
+        # Each field is read once; the logs and the signal share the locals
+        pair = intel.pair
+        action_str = decision.get("action", "HOLD")
+        confidence = float(decision.get("confidence", 0))
+        reasoning = decision.get("reasoning", "")
+
+        # Log analyst→strategist conversion
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[CONVERSION] %s: analyst=%.0f%% → strategist %s confidence=%.0f%%",
+                        pair, intel.fused_confidence * 100, action_str, confidence * 100)
+            logger.info("Strategist decision for %s: %s (confidence: %.0f%%)",
+                        pair, action_str, confidence * 100)
+
+        # Convert to TradeSignal
+        action = TRADE_ACTION_LOOKUP.get(action_str.upper(), TradeAction.HOLD)
+
+        signal = TradeSignal(
+            pair=pair,
+            action=action,
+            confidence=confidence,
+            size_pct=float(decision.get("size_pct", 0)),
+            reasoning=reasoning,
+            order_type=OrderType.MARKET,
+            stop_loss_pct=risk["stop_loss_pct"]
+        )
+
+        # Create plan
+        return TradingPlan(
+            signals=[signal],
+            strategy_name=decision.get("strategy", "unknown"),
+            regime=intel.regime.value,
+            overall_confidence=confidence,
+            reasoning=reasoning
+        )
+
+    @staticmethod
+    def _error_plan(intel: MarketIntel, error: Exception) -> TradingPlan:
+        message = str(error)
+        logger.error(f"Strategist error for {intel.pair}: {message}")
+
+        # Return HOLD on error. Built fresh rather than replace()d from a
+        # template: each plan needs its own id and timestamp.
+        return TradingPlan(
+            signals=[TradeSignal(
+                pair=intel.pair,
+                action=TradeAction.HOLD,
+                confidence=0.0,
+                size_pct=0.0,
+                reasoning="Error: " + message
+            )],
+            strategy_name="error",
+            overall_confidence=0.0,
+            reasoning="Strategy error: " + message
+        )
 
 
 class RuleBasedStrategist(IStrategist):
@@ -171,6 +530,7 @@ class RuleBasedStrategist(IStrategist):
     
     def __init__(self, settings: Settings = None):
         self.settings = settings or get_settings()
+        self._default_risk = _settings_risk(self.settings)
     
     async def create_plan(
         self,
@@ -179,19 +539,70 @@ class RuleBasedStrategist(IStrategist):
         risk_params: Dict = None
     ) -> TradingPlan:
         """Generate plan from rules only (no LLM)"""
-        risk = risk_params or {
-            "max_position_pct": self.settings.risk.max_position_pct,
-            "stop_loss_pct": self.settings.risk.stop_loss_pct,
-            "min_confidence": self.settings.risk.min_confidence
-        }
-        
+        return self.create_plan_sync(intel, portfolio, risk_params)
+
+    # Not named create_batch_plan: the orchestrator switches to batch mode
+    # for any strategist exposing that, and rules-only deployments should
+    # keep the sequential per-pair loop (fresh portfolio, per-pair errors)
+    async def decide_batch(
+        self,
+        intel_list: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None
+    ) -> TradingPlan:
+        """Apply the same rules to several pairs in one pass (no LLM)"""
+        return self.decide_batch_sync(intel_list, portfolio, risk_params)
+
+    # Rules do no I/O, so callers already on the event loop can skip the await
+    def create_plan_sync(
+        self,
+        intel: MarketIntel,
+        portfolio: Portfolio,
+        risk_params: Dict = None
+    ) -> TradingPlan:
+        signal = self._decide(intel, portfolio, risk_params or self._default_risk)
+
+        return TradingPlan(
+            signals=[signal],
+            strategy_name="rule_based",
+            regime=intel.regime.value,
+            overall_confidence=signal.confidence,
+            reasoning=signal.reasoning
+        )
+
+    def decide_batch_sync(
+        self,
+        intel_list: List[MarketIntel],
+        portfolio: Portfolio,
+        risk_params: Dict = None,
+        tag: str = ""
+    ) -> TradingPlan:
+        # tag is prepended to each signal's reasoning as it is built
+        risk = risk_params or self._default_risk
+        decide = self._decide
+        signals = [decide(intel, portfolio, risk, tag) for intel in intel_list]
+
+        active = [s for s in signals if s.action != TradeAction.HOLD]
+        overall_confidence = sum(s.confidence for s in active) / len(active) if active else 0.0
+
+        return TradingPlan(
+            signals=signals,
+            strategy_name="rule_based",
+            regime="mixed",
+            overall_confidence=overall_confidence,
+            reasoning=f"Rule-based batch: {len(signals)} pairs, {len(active)} actionable"
+        )
+
+    @staticmethod
+    def _decide(intel: MarketIntel, portfolio: Portfolio, risk: Dict, tag: str = "") -> TradeSignal:
+        """Apply the rules to one pair."""
         # Rule-based decision with tighter thresholds to reduce over-trading
         action = TradeAction.HOLD
         size_pct = 0.0
-        reasoning = "Rule-based analysis: "
+        reasoning = tag + "Rule-based analysis: " if tag else "Rule-based analysis: "
 
         # Check if we already hold this pair
-        base_asset = intel.pair.split("/")[0]
+        base_asset = intel.base_asset
         already_holding = (
             portfolio.positions
             and base_asset in portfolio.positions
@@ -214,8 +625,8 @@ class RuleBasedStrategist(IStrategist):
         else:
             confidence = intel.fused_confidence * 0.5
             reasoning += f"No clear signal (direction: {intel.fused_direction:+.2f})"
-        
-        signal = TradeSignal(
+
+        return TradeSignal(
             pair=intel.pair,
             action=action,
             confidence=confidence,
@@ -224,11 +635,3 @@ class RuleBasedStrategist(IStrategist):
             order_type=OrderType.MARKET,
             stop_loss_pct=risk["stop_loss_pct"]
         )
-        
-        return TradingPlan(
-            signals=[signal],
-            strategy_name="rule_based",
-            regime=intel.regime.value,
-            overall_confidence=confidence,
-            reasoning=reasoning
-        )
@@ -1,10 +1,11 @@
 """WebSocket connection manager for portfolio updates."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Dict, List
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,8 @@ logger = logging.getLogger(__name__)
 class ConnectionManager:
     """Manages WebSocket connections for portfolio updates."""
 
+    SEND_TIMEOUT = 5.0  # seconds before a stalled client is dropped
+
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
         self._connection_counter = 0
@@ -34,24 +37,30 @@ class ConnectionManager:
             logger.info(f"WebSocket client disconnected: {connection_id}")
 
     async def broadcast(self, message: dict):
-        """Broadcast a message to all connected clients."""
+        """Broadcast a message to all connected clients concurrently."""
         if not self.active_connections:
             logger.debug("No active WebSocket connections to broadcast to")
             return
 
-        dead_connections = []
-        for connection_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(json.dumps(message))
-            except WebSocketDisconnect:
-                logger.warning(f"WebSocket {connection_id} disconnected during broadcast")
-                dead_connections.append(connection_id)
-            except Exception as e:
-                logger.error(f"Error broadcasting to {connection_id}: {e}")
-                dead_connections.append(connection_id)
+        # Serialize once and fan out, so one slow client doesn't delay the rest
+        text = orjson.dumps(message).decode()
+        connections = list(self.active_connections.items())
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(websocket.send_text(text), self.SEND_TIMEOUT)
+                for _, websocket in connections
+            ),
+            return_exceptions=True
+        )
 
         # Clean up dead connections
-        for connection_id in dead_connections:
+        for (connection_id, _), result in zip(connections, results):
+            if isinstance(result, WebSocketDisconnect):
+                logger.warning(f"WebSocket {connection_id} disconnected during broadcast")
+            elif isinstance(result, Exception):
+                logger.error(f"Error broadcasting to {connection_id}: {result!r}")
+            else:
+                continue
             await self.disconnect(connection_id)
 
     @property
@@ -24,6 +24,10 @@ logger = logging.getLogger(__name__)
 class AlertChannel(ABC):
     """Base class for alert channels"""
 
+    # Channels that go over the network are dispatched in the background
+    # so a slow endpoint can't hold up the caller
+    remote: bool = False
+
     def __init__(self, name: str, enabled: bool = True):
         self.name = name
         self.enabled = enabled
@@ -82,6 +86,8 @@ class FileChannel(AlertChannel):
         self.file_path = Path(file_path)
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self._lock = asyncio.Lock()
+        self._file = None  # long-lived append handle, opened on first write
+        self._size = 0
 
         # Ensure directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -91,40 +97,48 @@ class FileChannel(AlertChannel):
             return False
 
         try:
+            line = f"{alert.format_message()}\n"
             async with self._lock:
-                # Check file size and rotate if needed
-                await self._maybe_rotate()
-
-                # Write alert
-                line = f"{alert.format_message()}\n"
-
-                # Use sync write in thread pool (more reliable)
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, self._write_line, line)
+                # Rotation check and write share one worker-thread hop, so
+                # no file I/O runs on the event loop
+                await asyncio.to_thread(self._append, line)
 
             return True
         except Exception as e:
             logger.error(f"File channel error: {e}")
             return False
 
-    def _write_line(self, line: str) -> None:
-        """Synchronous write"""
-        with open(self.file_path, "a", encoding="utf-8") as f:
-            f.write(line)
-
-    async def _maybe_rotate(self) -> None:
-        """Rotate log file if it exceeds max size"""
+    def _append(self, line: str) -> None:
+        """Rotate if needed, then append and flush one line (worker thread)."""
+        if self._file is None:
+            self._file = open(self.file_path, "a", encoding="utf-8")
+            self._size = self._file.tell()
+        if self._size > self.max_size_bytes:
+            self._rotate()
+        self._file.write(line)
+        self._file.flush()  # audit trail: don't lose alerts on a crash
+        self._size += len(line.encode("utf-8"))
+
+    def _rotate(self) -> None:
+        """Rotate log file by renaming it and reopening a fresh one"""
+        # Cleared first, so if the reopen below fails the next _append retries it
+        file, self._file = self._file, None
         try:
-            if self.file_path.exists():
-                size = self.file_path.stat().st_size
-                if size > self.max_size_bytes:
-                    # Rotate by renaming
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    backup_path = self.file_path.with_suffix(f".{timestamp}.log")
-                    self.file_path.rename(backup_path)
-                    logger.info(f"Rotated alert log to {backup_path}")
+            file.close()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_path = self.file_path.with_suffix(f".{timestamp}.log")
+            self.file_path.rename(backup_path)
+            logger.info(f"Rotated alert log to {backup_path}")
         except Exception as e:
             logger.error(f"Log rotation error: {e}")
+        self._file = open(self.file_path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._file is not None:
+                await asyncio.to_thread(self._file.close)
+                self._file = None
 
 
 class WebhookChannel(AlertChannel):
@@ -135,6 +149,8 @@ class WebhookChannel(AlertChannel):
     Slack format: {"text": "message"}
     """
 
+    remote = True
+
     def __init__(
         self,
         url: str,
@@ -147,6 +163,19 @@ class WebhookChannel(AlertChannel):
         self.url = url
         self.platform = platform.lower()
         self.timeout = timeout
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Reuse one session (and its keep-alive connections) across alerts."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     async def send(self, alert: "Alert") -> bool:
         if not self.enabled or not self.url:
@@ -171,18 +200,13 @@ class WebhookChannel(AlertChannel):
                     "embeds": self._format_discord_embeds(alert)
                 }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    if response.status in (200, 204):
-                        return True
-                    else:
-                        text = await response.text()
-                        logger.warning(f"Webhook returned {response.status}: {text[:200]}")
-                        return False
+            async with self._get_session().post(self.url, json=payload) as response:
+                if response.status in (200, 204):
+                    return True
+                else:
+                    text = await response.text()
+                    logger.warning(f"Webhook returned {response.status}: {text[:200]}")
+                    return False
 
         except asyncio.TimeoutError:
             logger.error(f"Webhook timeout after {self.timeout}s")
@@ -9,7 +9,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from collections import deque
 
 logger = logging.getLogger(__name__)
@@ -78,17 +78,28 @@ class AlertManager:
     def __init__(
         self,
         channels: List["AlertChannel"] = None,
-        max_history: int = 1000
+        max_history: int = 1000,
+        max_pending: int = 100
     ):
         self.channels = channels or []
         self.alert_history: deque = deque(maxlen=max_history)
+        self.max_pending = max_pending
         self._lock = asyncio.Lock()
         self._enabled = True
+        self._pending: Set[asyncio.Task] = set()
+        self._dropped = 0
+        self._split_channels()
         logger.info(f"AlertManager initialized with {len(self.channels)} channels")
 
+    def _split_channels(self) -> None:
+        """Precompute local (awaited) and remote (background) channel tuples."""
+        self._local_channels: Tuple["AlertChannel", ...] = tuple(ch for ch in self.channels if not ch.remote)
+        self._remote_channels: Tuple["AlertChannel", ...] = tuple(ch for ch in self.channels if ch.remote)
+
     def add_channel(self, channel: "AlertChannel") -> None:
         """Add an alert channel"""
         self.channels.append(channel)
+        self._split_channels()
         logger.info(f"Added alert channel: {channel.name}")
 
     def remove_channel(self, channel_name: str) -> bool:
@@ -96,25 +107,50 @@ class AlertManager:
         for i, ch in enumerate(self.channels):
             if ch.name == channel_name:
                 self.channels.pop(i)
+                self._split_channels()
                 logger.info(f"Removed alert channel: {channel_name}")
                 return True
         return False
 
     async def send(self, alert: Alert) -> None:
-        """Send alert to all channels"""
+        """
+        Send alert to all channels.
+
+        Local channels (console, file) are awaited; remote channels
+        (webhooks) are sent in a background task so the caller isn't held
+        up by network latency. At most max_pending background sends are
+        kept in flight; beyond that, remote delivery is dropped.
+        """
         if not self._enabled:
             return
 
         async with self._lock:
             self.alert_history.append(alert)
 
-        # Send to all channels concurrently
-        tasks = [channel.send(alert) for channel in self.channels]
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Channel {self.channels[i].name} failed: {result}")
+        if self._remote_channels:
+            if len(self._pending) < self.max_pending:
+                task = asyncio.create_task(self._dispatch(self._remote_channels, alert))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+            else:
+                self._dropped += 1
+                logger.warning(f"Alert backlog full ({self.max_pending}), skipped remote delivery")
+
+        if self._local_channels:
+            await self._dispatch(self._local_channels, alert)
+
+    @staticmethod
+    async def _dispatch(channels: Tuple["AlertChannel", ...], alert: Alert) -> None:
+        """Send to channels concurrently, logging failures."""
+        results = await asyncio.gather(*(channel.send(alert) for channel in channels), return_exceptions=True)
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                logger.error(f"Channel {channel.name} failed: {result}")
+
+    async def flush(self) -> None:
+        """Wait for background (remote) deliveries to finish."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
 
     async def trade_executed(
         self,
@@ -301,7 +337,9 @@ class AlertManager:
                 for ch in self.channels
             ],
             "history_size": len(self.alert_history),
-            "max_history": self.alert_history.maxlen
+            "max_history": self.alert_history.maxlen,
+            "pending_remote": len(self._pending),
+            "dropped_remote": self._dropped
         }
 
     def enable(self) -> None:
@@ -209,6 +209,14 @@ class CostOptimizationConfig:
 
     # Batch settings
     max_pairs_per_batch: int = 10
+    max_input_tokens: int = 150_000     # Larger batch prompts are split into sub-batches
+    allow_deferred_batch: bool = False  # Let callers with a long latency budget use the Batches API (50% off)
+    max_concurrent_llm_calls: int = 8   # Cap on parallel per-pair Claude calls (provider rate limits)
+    adaptive_batch_size: bool = False   # Tune hybrid Claude batch size (<= max_pairs_per_batch) from measured latency
+
+    # Decision distillation
+    enable_decision_distiller: bool = False  # Serve confident intel bins from past Claude decisions
+    distiller_shadow_rate: float = 0.1       # Share of confident bins still sent to Claude to check the distiller
 
 
 @dataclass
@@ -394,6 +402,12 @@ class Settings:
             enable_decision_cache=cost_opt_data.get("enable_decision_cache", False),
             cache_ttl_seconds=cost_opt_data.get("cache_ttl_seconds", 1800),
             cache_price_deviation=cost_opt_data.get("cache_price_deviation", 0.02),
+            max_input_tokens=cost_opt_data.get("max_input_tokens", 150_000),
+            allow_deferred_batch=cost_opt_data.get("allow_deferred_batch", False),
+            max_concurrent_llm_calls=cost_opt_data.get("max_concurrent_llm_calls", 8),
+            adaptive_batch_size=cost_opt_data.get("adaptive_batch_size", False),
+            enable_decision_distiller=cost_opt_data.get("enable_decision_distiller", False),
+            distiller_shadow_rate=cost_opt_data.get("distiller_shadow_rate", 0.1),
         )
 
         # Parse hybrid thresholds if present
@@ -3,10 +3,12 @@
 
 from core.ml.regime_classifier import RegimeClassifier, MarketRegime
 from core.ml.anomaly_model import AnomalyDetector, AnomalyResult
+from core.ml.decision_distiller import DecisionDistiller
 
 __all__ = [
     "RegimeClassifier",
     "MarketRegime",
     "AnomalyDetector",
     "AnomalyResult",
+    "DecisionDistiller",
 ]
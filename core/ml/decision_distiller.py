@@ -0,0 +1,161 @@
+"""
+LLM Decision Distiller
+
+Learns the strategist LLM's decisions as a function of the intel it saw:
+- Fused direction and confidence (binned)
+- Market regime
+- Whether the pair is already held
+- The max_position_pct risk limit (size_pct is relative to it)
+
+Once a bin has enough history and the LLM has agreed with itself often
+enough, the bin's majority decision can be served locally instead of
+calling the LLM again. A sampled share of those confident predictions
+is withheld (shadow_rate) so the LLM keeps deciding them; its answer is
+recorded as usual and compared with the withheld prediction, so drift
+shows up as logged disagreements instead of going unnoticed.
+
+Uses a simple frequency table that can be replaced with a trained
+classifier (e.g. gradient-boosted trees) once decisions are logged.
+"""
+
+import logging
+import random
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from core.models import MarketIntel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BinStats:
+    """Decision counts and running sums for one feature bin"""
+    total: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+    confidence_sums: Dict[str, float] = field(default_factory=dict)
+    size_sums: Dict[str, float] = field(default_factory=dict)
+
+
+class DecisionDistiller:
+    """
+    Frequency-table model of past LLM trading decisions.
+
+    predict() answers only for bins with at least min_samples recorded
+    decisions whose most common action has at least min_agreement share;
+    everything else returns None so the caller asks the LLM. A
+    shadow_rate share of confident bins also returns None, and the next
+    record() for that bin is checked against the withheld prediction.
+    """
+
+    def __init__(
+        self,
+        bucket: float = 0.1,
+        min_samples: int = 20,
+        min_agreement: float = 0.85,
+        max_bins: int = 4096,
+        shadow_rate: float = 0.0
+    ):
+        """
+        Initialize decision distiller.
+
+        Args:
+            bucket: Bin width for fused direction and confidence
+            min_samples: Decisions a bin needs before it is trusted
+            min_agreement: Share of the majority action required to predict
+            max_bins: Least recently updated bins are dropped beyond this
+            shadow_rate: Share of confident predictions left to the LLM as a check
+        """
+        self.bucket = bucket
+        self.min_samples = min_samples
+        self.min_agreement = min_agreement
+        self.max_bins = max_bins
+        self.shadow_rate = shadow_rate
+        self._bins: "OrderedDict[Tuple, _BinStats]" = OrderedDict()
+        # Bin key -> action withheld by predict() for a shadow check
+        self._shadowed: Dict[Tuple, str] = {}
+        self._predictions = 0
+        self._abstentions = 0
+        self._shadow_checks = 0
+        self._disagreements = 0
+
+    def _key(self, intel: MarketIntel, holding: bool, max_position_pct: float) -> Tuple:
+        return (
+            round(intel.fused_direction / self.bucket),
+            round(intel.fused_confidence / self.bucket),
+            intel.regime.value,
+            holding,
+            # Risk limits come from a handful of configured values, so they
+            # are keyed exactly rather than binned
+            round(max_position_pct, 4)
+        )
+
+    def record(self, intel: MarketIntel, holding: bool, max_position_pct: float, decision: Dict) -> None:
+        """Add one LLM decision to the table."""
+        try:
+            action = str(decision.get("action", "HOLD")).upper()
+            confidence = float(decision.get("confidence", 0))
+            size_pct = float(decision.get("size_pct", 0))
+        except (TypeError, ValueError):
+            return
+
+        key = self._key(intel, holding, max_position_pct)
+        shadowed = self._shadowed.pop(key, None)
+        if shadowed is not None:
+            self._shadow_checks += 1
+            if shadowed != action:
+                self._disagreements += 1
+                logger.info(
+                    "[DISTILLER] %s: predicted %s but LLM chose %s (direction=%+.2f, confidence=%.0f%%)",
+                    intel.pair, shadowed, action, intel.fused_direction, intel.fused_confidence * 100
+                )
+
+        stats = self._bins.get(key)
+        if stats is None:
+            stats = self._bins[key] = _BinStats()
+            if len(self._bins) > self.max_bins:
+                self._bins.popitem(last=False)
+        else:
+            self._bins.move_to_end(key)
+
+        stats.total += 1
+        stats.counts[action] = stats.counts.get(action, 0) + 1
+        stats.confidence_sums[action] = stats.confidence_sums.get(action, 0.0) + confidence
+        stats.size_sums[action] = stats.size_sums.get(action, 0.0) + size_pct
+
+    def predict(self, intel: MarketIntel, holding: bool, max_position_pct: float) -> Optional[Dict]:
+        """Return the bin's majority decision, or None if the LLM should decide."""
+        key = self._key(intel, holding, max_position_pct)
+        stats = self._bins.get(key)
+        if stats is None or stats.total < self.min_samples:
+            self._abstentions += 1
+            return None
+
+        action, count = max(stats.counts.items(), key=lambda item: item[1])
+        agreement = count / stats.total
+        if agreement < self.min_agreement:
+            self._abstentions += 1
+            return None
+
+        if self.shadow_rate > 0 and random.random() < self.shadow_rate:
+            self._shadowed[key] = action
+            return None
+
+        self._predictions += 1
+        return {
+            "action": action,
+            "confidence": stats.confidence_sums[action] / count,
+            "size_pct": stats.size_sums[action] / count,
+            "strategy": "distilled",
+            "reasoning": f"Distilled: LLM chose {action} in {agreement:.0%} of {stats.total} similar cases"
+        }
+
+    def get_stats(self) -> Dict:
+        return {
+            "bins": len(self._bins),
+            "predictions": self._predictions,
+            "abstentions": self._abstentions,
+            "shadow_checks": self._shadow_checks,
+            "disagreements": self._disagreements
+        }
@@ -1,4 +1,4 @@
 # Core models
 from core.models.signals import AnalystSignal, MarketData, MarketIntel, Direction, Regime
-from core.models.trading import Trade, TradeSignal, TradingPlan, ExecutionReport, TradeAction, TradeStatus, OrderType
+from core.models.trading import Trade, TradeSignal, TradingPlan, ExecutionReport, TradeAction, TradeStatus, OrderType, TRADE_ACTION_LOOKUP
 from core.models.portfolio import Portfolio, Position, PerformanceMetrics
@@ -140,8 +140,29 @@ class Portfolio:
             "timestamp": self.timestamp.isoformat()
         }
     
+    def _summary_state(self) -> tuple:
+        """Fields that to_summary() depends on, used to detect changes"""
+        return (
+            self.available_quote,
+            self.initial_value,
+            tuple(
+                (symbol, pos.amount, pos.current_price, pos.entry_price)
+                for symbol, pos in self.positions.items()
+            )
+        )
+
     def to_summary(self) -> str:
-        """Compact summary for prompts (token-optimized)"""
+        """
+        Compact summary for prompts (token-optimized).
+
+        Memoized per snapshot: repeated calls return the cached string until
+        cash, a position amount or a price changes.
+        """
+        state = self._summary_state()
+        cached = self.__dict__.get("_summary_cache")
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
         positions_summary = ", ".join([
             f"{symbol}: ${pos.value_quote:,.0f} ({pos.unrealized_pnl_pct:+.1f}%)"
             if pos.entry_price else
@@ -149,11 +170,13 @@ class Portfolio:
             for symbol, pos in self.positions.items()
         ]) or "None"
 
-        return (
+        summary = (
             f"Value: ${self.total_value:,.0f} | Cash: ${self.available_quote:,.0f} | "
             f"Exposure: {self.exposure_pct:.0f}% | P&L: ${self.total_pnl:+,.0f}\n"
             f"Positions: {positions_summary}"
         )
+        self._summary_cache = (state, summary)
+        return summary
 
 
 @dataclass
@@ -7,6 +7,7 @@ that feeds into the strategist.
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Dict, List, Optional, Any
 from enum import Enum
 
@@ -119,7 +120,13 @@ class MarketIntel:
     fused_confidence: float              # Overall confidence
     regime: Regime = Regime.UNKNOWN
     disagreement: float = 0.0            # How much analysts disagree (0-1)
+    price: float = 0.0                   # Current price when the producer knows it (0 = unknown)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @cached_property
+    def base_asset(self) -> str:
+        """Base currency of the pair (BTC for BTC/AUD), split once per intel"""
+        return self.pair.partition("/")[0]
     
     @property
     def is_actionable(self) -> bool:
@@ -18,6 +18,10 @@ class TradeAction(Enum):
     HOLD = "HOLD"
 
 
+# Action name -> TradeAction, for parsing LLM responses without probing __members__ per call
+TRADE_ACTION_LOOKUP: Dict[str, TradeAction] = dict(TradeAction.__members__)
+
+
 class TradeStatus(Enum):
     """Trade execution status"""
     PENDING = "pending"
@@ -40,7 +44,7 @@ class OrderType(Enum):
     BREAKEVEN_STOP = "breakeven_stop"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     """
     A trading signal from the strategist.
@@ -179,7 +183,7 @@ class Trade:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingPlan:
     """
     A complete trading plan from the strategist.
@@ -75,6 +75,12 @@ class BinanceExchange(IExchange):
             self._client = httpx.AsyncClient(timeout=30)
         return self._client
 
+    async def close(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     @property
     def name(self) -> str:
         return "binance"
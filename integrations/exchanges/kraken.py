@@ -65,6 +65,20 @@ class KrakenExchange(IExchange):
         
         if not self.api_key or not self.api_secret:
             logger.warning("Kraken API credentials not configured")
+
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return a shared httpx.AsyncClient, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     @property
     def name(self) -> str:
@@ -95,15 +109,15 @@ class KrakenExchange(IExchange):
         """Make public API request"""
         url = f"{self.BASE_URL}/0/public/{endpoint}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get("error"):
-                raise Exception(f"Kraken API error: {data['error']}")
-            
-            return data.get("result", {})
+        client = await self._get_client()
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        if data.get("error"):
+            raise Exception(f"Kraken API error: {data['error']}")
+
+        return data.get("result", {})
     
     async def _private_request(self, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """Make authenticated API request"""
@@ -121,15 +135,15 @@ class KrakenExchange(IExchange):
             "API-Sign": self._generate_signature(urlpath, data)
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=data, headers=headers, timeout=30)
-            response.raise_for_status()
-            result = response.json()
-            
-            if result.get("error"):
-                raise Exception(f"Kraken API error: {result['error']}")
-            
-            return result.get("result", {})
+        client = await self._get_client()
+        response = await client.post(url, data=data, headers=headers)
+        response.raise_for_status()
+        result = response.json()
+
+        if result.get("error"):
+            raise Exception(f"Kraken API error: {result['error']}")
+
+        return result.get("result", {})
     
     async def get_balance(self) -> Dict[str, float]:
         """Get account balance"""
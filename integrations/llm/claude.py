@@ -7,8 +7,11 @@ Implements the ILLM interface for Anthropic's Claude API.
 import os
 import json
 import re
+import time
+import asyncio
 import logging
-from typing import Dict, Optional
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import anthropic
 import httpx
@@ -17,6 +20,12 @@ from core.interfaces import ILLM
 
 logger = logging.getLogger(__name__)
 
+# Anthropic client transport settings. Reads allow for long batch-strategist
+# completions; connects fail fast so retries start early.
+CLAUDE_MAX_RETRIES = 3
+CLAUDE_CONNECT_TIMEOUT = 2.0
+CLAUDE_READ_TIMEOUT = 60.0
+
 
 class ClaudeLLM(ILLM):
     """
@@ -36,10 +45,20 @@ class ClaudeLLM(ILLM):
         # Token usage tracking
         self._total_input_tokens = 0
         self._total_output_tokens = 0
+        self._total_cache_read_tokens = 0
+        self._total_cache_write_tokens = 0
         self._total_calls = 0
 
         if self.api_key:
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            # The client keeps a pooled HTTP connection for its lifetime, so
+            # concurrent strategist calls reuse warm TLS connections. It
+            # retries timeouts, 429s and 5xx with jittered exponential
+            # backoff (honouring retry-after) before an error surfaces.
+            self.client = anthropic.Anthropic(
+                api_key=self.api_key,
+                max_retries=CLAUDE_MAX_RETRIES,
+                timeout=anthropic.Timeout(CLAUDE_READ_TIMEOUT, connect=CLAUDE_CONNECT_TIMEOUT)
+            )
             logger.info(f"Claude LLM initialized with model: {model}")
         else:
             self.client = None
@@ -53,19 +72,28 @@ class ClaudeLLM(ILLM):
         if hasattr(message, 'usage'):
             inp = message.usage.input_tokens
             out = message.usage.output_tokens
+            # Prompt-cache tokens are billed separately from input_tokens
+            cache_read = getattr(message.usage, "cache_read_input_tokens", None) or 0
+            cache_write = getattr(message.usage, "cache_creation_input_tokens", None) or 0
             self._total_input_tokens += inp
             self._total_output_tokens += out
+            self._total_cache_read_tokens += cache_read
+            self._total_cache_write_tokens += cache_write
             self._total_calls += 1
-            logger.info(f"[TOKENS] {caller}: in={inp} out={out} | cumulative: in={self._total_input_tokens} out={self._total_output_tokens} calls={self._total_calls}")
+            logger.info(f"[TOKENS] {caller}: in={inp} out={out} cache_read={cache_read} cache_write={cache_write} | cumulative: in={self._total_input_tokens} out={self._total_output_tokens} calls={self._total_calls}")
 
     def get_usage_stats(self) -> Dict:
         """Get cumulative token usage statistics."""
         return {
             "total_input_tokens": self._total_input_tokens,
             "total_output_tokens": self._total_output_tokens,
+            "total_cache_read_tokens": self._total_cache_read_tokens,
+            "total_cache_write_tokens": self._total_cache_write_tokens,
             "total_calls": self._total_calls,
             "estimated_cost_usd": round(
                 self._total_input_tokens * 3 / 1_000_000 +
+                self._total_cache_read_tokens * 0.3 / 1_000_000 +
+                self._total_cache_write_tokens * 3.75 / 1_000_000 +
                 self._total_output_tokens * 15 / 1_000_000, 4
             )
         }
@@ -214,48 +242,227 @@ class ClaudeLLM(ILLM):
         self,
         prompt: str,
         system_prompt: str = None,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        tool: Optional[Dict] = None
     ) -> Dict:
         """
         Specialized method for market analysis with optional system prompt.
+
+        If a tool definition is given, Claude is forced to call it and the
+        tool input is returned directly, skipping text JSON parsing. The
+        Codex fallback ignores the tool and parses the text response.
         """
         if self.client:
             try:
-                messages = [{"role": "user", "content": prompt}]
-
-                kwargs = {
-                    "model": self.model,
-                    "max_tokens": max_tokens,
-                    "messages": messages
-                }
-
-                if system_prompt:
-                    kwargs["system"] = system_prompt
-
-                message = self.client.messages.create(**kwargs)
+                params = self._build_analysis_params(prompt, system_prompt, max_tokens, tool)
+                # Off the event loop, so concurrent per-pair calls overlap
+                message = await asyncio.to_thread(self.client.messages.create, **params)
                 self._track_usage(message, "analyze_market")
-                response_text = message.content[0].text.strip()
+                return self._extract_analysis(message, tool)
             except Exception as e:
                 if self._can_use_codex_fallback() and self._looks_like_connection_failure(e):
                     logger.warning(f"Claude connection failed for market analysis, falling back to Codex: {e}")
-                    response_text = self._complete_with_codex(
-                        prompt,
-                        max_tokens=max_tokens,
-                        system_prompt=system_prompt
-                    ).strip()
+                    response_text = (await asyncio.to_thread(
+                        self._complete_with_codex, prompt, max_tokens=max_tokens, system_prompt=system_prompt
+                    )).strip()
                 else:
                     raise
         elif self._can_use_codex_fallback():
             logger.warning("Claude not configured for market analysis, falling back to Codex")
-            response_text = self._complete_with_codex(
-                prompt,
-                max_tokens=max_tokens,
-                system_prompt=system_prompt
-            ).strip()
+            response_text = (await asyncio.to_thread(
+                self._complete_with_codex, prompt, max_tokens=max_tokens, system_prompt=system_prompt
+            )).strip()
         else:
             raise Exception("Claude API not configured")
-        
-        # Parse JSON (handles both objects and arrays)
+
+        return self._parse_analysis_text(response_text)
+
+    async def stream_market_analysis(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        max_tokens: int = 1000,
+        tool: Optional[Dict] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a market analysis as raw JSON text fragments.
+
+        Yields text deltas, or the tool input fragments when a tool is forced,
+        so callers can act on early results before generation finishes. The
+        Codex fallback yields its whole response as a single fragment.
+        """
+        if not self.client:
+            if self._can_use_codex_fallback():
+                logger.warning("Claude not configured for market analysis, falling back to Codex")
+                yield await asyncio.to_thread(
+                    self._complete_with_codex, prompt, max_tokens=max_tokens, system_prompt=system_prompt
+                )
+                return
+            raise Exception("Claude API not configured")
+
+        params = self._build_analysis_params(prompt, system_prompt, max_tokens, tool)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def pump() -> None:
+            # The client is synchronous: opening the stream and reading its
+            # events both block, so the whole exchange runs in a worker
+            # thread and hands fragments back to the loop through the queue
+            try:
+                with self.client.messages.stream(**params) as stream:
+                    for event in stream:
+                        if stop.is_set():
+                            return
+                        if event.type != "content_block_delta":
+                            continue
+                        if event.delta.type == "text_delta":
+                            fragment = event.delta.text
+                        elif event.delta.type == "input_json_delta":
+                            fragment = event.delta.partial_json
+                        else:
+                            continue
+                        loop.call_soon_threadsafe(queue.put_nowait, ("fragment", fragment))
+                    final = stream.get_final_message()
+                loop.call_soon_threadsafe(queue.put_nowait, ("done", final))
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, ("error", e))
+
+        worker = asyncio.ensure_future(asyncio.to_thread(pump))
+        yielded = False
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == "fragment":
+                    yielded = True
+                    yield value
+                elif kind == "done":
+                    self._track_usage(value, "stream_market_analysis")
+                    break
+                elif (not yielded and self._can_use_codex_fallback()
+                      and self._looks_like_connection_failure(value)):
+                    # Nothing has reached the caller yet, so the Codex
+                    # answer can stand in for the whole stream
+                    logger.warning(f"Claude connection failed for streamed analysis, falling back to Codex: {value}")
+                    yield await asyncio.to_thread(
+                        self._complete_with_codex, prompt, max_tokens=max_tokens, system_prompt=system_prompt
+                    )
+                    break
+                else:
+                    raise value
+        finally:
+            # Let an abandoned stream's thread exit at its next event
+            stop.set()
+        await worker
+
+    async def analyze_market_batch(
+        self,
+        requests: List[Dict],
+        poll_interval: float = 10.0,
+        timeout: float = 3600.0
+    ) -> Dict[str, Any]:
+        """
+        Run market analyses through the Message Batches API.
+
+        Batches are billed at half the real-time rate but may take minutes
+        to complete, so this suits scheduled or offline analysis only.
+
+        Args:
+            requests: Dicts with custom_id, prompt and optional system_prompt,
+                max_tokens and tool (same meaning as analyze_market)
+            poll_interval: Seconds between status checks
+            timeout: Seconds to wait before cancelling the batch
+
+        Returns:
+            custom_id -> parsed analysis. Failed or expired requests are omitted.
+        """
+        if not self.client:
+            raise Exception("Claude API not configured")
+
+        tools = {}
+        batch_requests = []
+        for req in requests:
+            tools[req["custom_id"]] = req.get("tool")
+            batch_requests.append({
+                "custom_id": req["custom_id"],
+                "params": self._build_analysis_params(
+                    req["prompt"],
+                    req.get("system_prompt"),
+                    req.get("max_tokens", 1000),
+                    req.get("tool")
+                )
+            })
+
+        # The SDK is synchronous; every batches call runs in a worker thread
+        batches = self.client.messages.batches
+        batch = await asyncio.to_thread(batches.create, requests=batch_requests)
+        logger.info(f"[BATCH_API] Submitted message batch {batch.id} with {len(batch_requests)} requests")
+
+        deadline = time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() > deadline:
+                await asyncio.to_thread(batches.cancel, batch.id)
+                raise TimeoutError(f"Message batch {batch.id} did not finish within {timeout:.0f}s")
+            await asyncio.sleep(poll_interval)
+            batch = await asyncio.to_thread(batches.retrieve, batch.id)
+
+        # results() streams JSONL lazily, so drain it in the thread too
+        entries = await asyncio.to_thread(lambda: list(batches.results(batch.id)))
+        results = {}
+        for entry in entries:
+            if entry.result.type != "succeeded":
+                logger.warning(f"[BATCH_API] Request {entry.custom_id} {entry.result.type}")
+                continue
+            message = entry.result.message
+            self._track_usage(message, "analyze_market_batch")
+            try:
+                results[entry.custom_id] = self._extract_analysis(message, tools.get(entry.custom_id))
+            except ValueError as e:
+                logger.warning(f"[BATCH_API] Could not parse result for {entry.custom_id}: {e}")
+
+        return results
+
+    def _build_analysis_params(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        tool: Optional[Dict]
+    ) -> Dict:
+        """Build Messages API parameters for a market analysis call."""
+        params = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+
+        if system_prompt:
+            # Cache breakpoint on the static prefix (tool + system prompt).
+            # Prefixes under the model's minimum (1024 tokens on Sonnet) are
+            # simply not cached, so marking every call is safe.
+            params["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+
+        if tool:
+            params["tools"] = [tool]
+            params["tool_choice"] = {"type": "tool", "name": tool["name"]}
+
+        return params
+
+    def _extract_analysis(self, message, tool: Optional[Dict] = None) -> Any:
+        """Return the tool input (if a tool was forced) or the parsed text JSON."""
+        if tool:
+            for block in message.content:
+                if getattr(block, "type", None) == "tool_use":
+                    return block.input
+
+        return self._parse_analysis_text(message.content[0].text.strip())
+
+    def _parse_analysis_text(self, response_text: str) -> Any:
+        """Parse JSON (objects or arrays) from a text response."""
         try:
             return json.loads(response_text)
         except json.JSONDecodeError:
@@ -42,7 +42,6 @@ def setup_logging():
     # Reduce noise from libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("apscheduler").setLevel(logging.WARNING)
 
 
 def main():
@@ -98,7 +97,11 @@ def main():
         "api.app:app",
         host=host,
         port=port,
-        reload=os.getenv("DEBUG", "").lower() == "true"
+        reload=os.getenv("DEBUG", "").lower() == "true",
+        # Protocol-level keepalive for /ws/portfolio (dead clients are
+        # dropped without any application-level ping handling)
+        ws_ping_interval=20.0,
+        ws_ping_timeout=20.0
     )
 
 
@@ -7,7 +7,7 @@ and improve performance of frequent data access.
 
 import logging
 import json
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import timedelta
 import redis.asyncio as redis
 
@@ -363,6 +363,50 @@ class RedisCache:
             logger.info(f"[CACHE] Cached decision for {pair} (hash={intel_hash[:8]})")
         return success
 
+    async def cache_decisions_bulk(
+        self,
+        entries: List[Tuple[str, str, Dict, float, int]]
+    ) -> bool:
+        """
+        Cache several trading decisions in one round-trip.
+
+        Args:
+            entries: (pair, intel_hash, decision, price_at_decision, ttl) tuples,
+                same meaning as cache_decision
+
+        Returns:
+            True if all were cached successfully
+        """
+        if not entries:
+            return True
+
+        if not self._client:
+            logger.warning("Redis not connected, skipping cache set")
+            return False
+
+        try:
+            timestamp = self._get_timestamp()
+            async with self._client.pipeline(transaction=False) as pipe:
+                for pair, intel_hash, decision, price_at_decision, ttl in entries:
+                    key = f"decision:{pair}:{intel_hash}"
+                    value = json.dumps({
+                        "decision": decision,
+                        "price": price_at_decision,
+                        "timestamp": timestamp
+                    })
+                    if ttl > 0:
+                        pipe.setex(key, ttl, value)
+                    else:
+                        pipe.set(key, value)
+                await pipe.execute()
+
+            logger.info(f"[CACHE] Cached {len(entries)} decisions in one pipeline")
+            return True
+
+        except Exception as e:
+            logger.error(f"Redis pipeline SET error for {len(entries)} decisions: {e}")
+            return False
+
     async def get_cached_decision(
         self,
         pair: str,
@@ -423,6 +467,71 @@ class RedisCache:
             await self.delete(key)
             return None
 
+    async def get_cached_decisions_bulk(
+        self,
+        items: List[Tuple[str, str, float]],
+        max_price_deviation: float = 0.02
+    ) -> List[Optional[Dict]]:
+        """
+        Get several cached trading decisions in one round-trip.
+
+        Same validity rules as get_cached_decision; invalid entries are
+        deleted together afterwards.
+
+        Args:
+            items: (pair, intel_hash, current_price) tuples
+            max_price_deviation: Maximum allowed price change (decimal)
+
+        Returns:
+            Cached decision dict or None per item, in order
+        """
+        if not items:
+            return []
+
+        if not self._client:
+            logger.warning("Redis not connected, cache miss")
+            return [None] * len(items)
+
+        keys = [f"decision:{pair}:{intel_hash}" for pair, intel_hash, _ in items]
+        try:
+            values = await self._client.mget(keys)
+        except Exception as e:
+            logger.error(f"Redis MGET error for {len(keys)} decisions: {e}")
+            return [None] * len(items)
+
+        results: List[Optional[Dict]] = []
+        stale = []
+        for (pair, _, current_price), key, value in zip(items, keys, values):
+            if not value:
+                results.append(None)
+                continue
+
+            try:
+                data = json.loads(value)
+                cached_price = data.get("price", 0)
+            except (json.JSONDecodeError, AttributeError) as e:
+                logger.error(f"[CACHE] Failed to parse cached decision for {pair}: {e}")
+                stale.append(key)
+                results.append(None)
+                continue
+
+            if cached_price <= 0 or abs(current_price - cached_price) / cached_price > max_price_deviation:
+                stale.append(key)
+                results.append(None)
+                continue
+
+            results.append(data.get("decision"))
+
+        if stale:
+            try:
+                await self._client.delete(*stale)
+            except Exception as e:
+                logger.error(f"Redis DELETE error for {len(stale)} stale decisions: {e}")
+
+        hits = sum(1 for r in results if r is not None)
+        logger.info(f"[CACHE] Bulk decision lookup: {hits}/{len(items)} hits, {len(stale)} invalidated")
+        return results
+
     async def invalidate_decisions(self, pair: Optional[str] = None) -> int:
         """
         Invalidate cached decisions.
@@ -0,0 +1,145 @@
+"""Tests for the alert manager and its channels."""
+import asyncio
+import builtins
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.alerts import Alert, AlertChannel, AlertLevel, AlertManager, AlertType, FileChannel
+
+
+def _alert(message: str = "test") -> Alert:
+    return Alert(type=AlertType.SYSTEM, level=AlertLevel.INFO, message=message)
+
+
+def _run(coro):
+    # Own loop: earlier test modules may leave no current event loop behind
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class GatedRemoteChannel(AlertChannel):
+    """Remote channel whose sends block until the gate opens."""
+
+    remote = True
+
+    def __init__(self):
+        super().__init__("gated")
+        self.gate = asyncio.Event()
+        self.sent = []
+
+    async def send(self, alert: Alert) -> bool:
+        await self.gate.wait()
+        self.sent.append(alert.message)
+        return True
+
+
+# ---------------------------------------------------------------------------
+# Background remote delivery
+# ---------------------------------------------------------------------------
+
+class TestRemoteBacklog:
+    def test_backlog_limit_drops_and_counts(self):
+        async def run():
+            channel = GatedRemoteChannel()
+            manager = AlertManager(channels=[channel], max_pending=2)
+            for i in range(3):
+                await manager.send(_alert(f"alert {i}"))
+
+            config = manager.get_config()
+            channel.gate.set()
+            await manager.flush()
+            return channel, manager, config
+
+        channel, manager, config = _run(run())
+
+        assert config["pending_remote"] == 2
+        assert config["dropped_remote"] == 1
+        assert channel.sent == ["alert 0", "alert 1"]
+        assert len(manager.alert_history) == 3
+
+    def test_flush_waits_for_background_sends(self):
+        async def run():
+            channel = GatedRemoteChannel()
+            manager = AlertManager(channels=[channel])
+            await manager.send(_alert())
+            assert channel.sent == []
+
+            asyncio.get_running_loop().call_later(0.01, channel.gate.set)
+            await manager.flush()
+            return channel, manager
+
+        channel, manager = _run(run())
+
+        assert channel.sent == ["test"]
+        assert manager.get_config()["pending_remote"] == 0
+
+
+# ---------------------------------------------------------------------------
+# File channel
+# ---------------------------------------------------------------------------
+
+class TestFileChannel:
+    def test_rotates_when_over_size(self, tmp_path):
+        path = tmp_path / "alerts.log"
+        channel = FileChannel(str(path))
+        channel.max_size_bytes = 10
+
+        async def run():
+            assert await channel.send(_alert("first"))
+            assert await channel.send(_alert("second"))
+            await channel.close()
+
+        _run(run())
+
+        backups = [p for p in tmp_path.iterdir() if p != path]
+        assert len(backups) == 1
+        assert "first" in backups[0].read_text(encoding="utf-8")
+        assert "second" in path.read_text(encoding="utf-8")
+        assert "first" not in path.read_text(encoding="utf-8")
+
+    def test_reopens_after_close(self, tmp_path):
+        path = tmp_path / "alerts.log"
+        channel = FileChannel(str(path))
+
+        async def run():
+            await channel.send(_alert("before"))
+            await channel.close()
+            await channel.send(_alert("after"))
+            await channel.close()
+
+        _run(run())
+
+        text = path.read_text(encoding="utf-8")
+        assert "before" in text and "after" in text
+
+    def test_failed_reopen_is_retried(self, tmp_path, monkeypatch):
+        path = tmp_path / "alerts.log"
+        channel = FileChannel(str(path))
+        channel.max_size_bytes = 10
+        real_open = builtins.open
+        opens = []
+
+        def flaky_open(*args, **kwargs):
+            opens.append(args[0])
+            if len(opens) == 2:
+                raise OSError("disk unavailable")
+            return real_open(*args, **kwargs)
+
+        monkeypatch.setattr("core.alerts.channels.open", flaky_open, raising=False)
+
+        async def run():
+            assert await channel.send(_alert("first"))
+            # Rotation closes the old handle and the reopen fails
+            assert not await channel.send(_alert("lost"))
+            assert channel._file is None
+            assert await channel.send(_alert("third"))
+            await channel.close()
+
+        _run(run())
+
+        assert "third" in path.read_text(encoding="utf-8")
@@ -0,0 +1,342 @@
+"""Tests for the batch strategists."""
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from agents.strategist.batch import BatchStrategist, RuleBasedBatchStrategist
+from core.config import Settings
+from core.models import MarketIntel, Portfolio, TradeAction
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+RISK = {"max_position_pct": 0.2, "stop_loss_pct": 0.05, "min_confidence": 0.6}
+
+
+def _intel(pair: str, direction: float = 0.0, confidence: float = 0.5) -> MarketIntel:
+    return MarketIntel(pair=pair, signals=[], fused_direction=direction, fused_confidence=confidence)
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+def _strategist() -> BatchStrategist:
+    return BatchStrategist(llm=None, settings=Settings())
+
+
+# ---------------------------------------------------------------------------
+# Response parsing
+# ---------------------------------------------------------------------------
+
+class TestParseBatchResponse:
+    def test_bare_json_array(self):
+        response = '[{"pair": "BTC/AUD", "action": "BUY", "confidence": 0.8, "size_pct": 0.1}]'
+        signals = _strategist()._parse_batch_response(response, [_intel("BTC/AUD")], RISK)
+        assert signals[0].action == TradeAction.BUY
+        assert signals[0].confidence == 0.8
+
+    def test_code_fenced_array(self):
+        response = (
+            "```json\n"
+            '[{"pair": "ETH/AUD", "action": "SELL", "confidence": 0.7, "size_pct": 1.0}]\n'
+            "```"
+        )
+        signals = _strategist()._parse_batch_response(response, [_intel("ETH/AUD")], RISK)
+        assert signals[0].action == TradeAction.SELL
+
+    def test_array_wrapped_in_prose(self):
+        response = (
+            "Here are the decisions:\n"
+            '[{"pair": "SOL/AUD", "action": "BUY", "confidence": 0.9, "size_pct": 0.2, '
+            '"key_factors": ["trend", "volume"]}]\n'
+            "Let me know if you need more detail."
+        )
+        signals = _strategist()._parse_batch_response(response, [_intel("SOL/AUD")], RISK)
+        assert signals[0].action == TradeAction.BUY
+
+    def test_brackets_in_trailing_prose_are_ignored(self):
+        response = (
+            "Decisions [v2]:\n"
+            '[{"pair": "SOL/AUD", "action": "SELL", "confidence": 0.7}]\n'
+            "Note: watch [support] levels."
+        )
+        signals = _strategist()._parse_batch_response(response, [_intel("SOL/AUD")], RISK)
+        assert signals[0].action == TradeAction.SELL
+
+    def test_missing_pair_defaults_to_hold(self):
+        response = '[{"pair": "BTC/AUD", "action": "BUY", "confidence": 0.8}]'
+        intel_list = [_intel("BTC/AUD"), _intel("ETH/AUD")]
+        signals = _strategist()._parse_batch_response(response, intel_list, RISK)
+        assert [s.pair for s in signals] == ["BTC/AUD", "ETH/AUD"]
+        assert signals[1].action == TradeAction.HOLD
+
+    def test_unparseable_response_holds_all(self):
+        signals = _strategist()._parse_batch_response("not json", [_intel("BTC/AUD")], RISK)
+        assert signals[0].action == TradeAction.HOLD
+
+    def test_unknown_action_is_hold(self):
+        response = [{"pair": "BTC/AUD", "action": "moon", "confidence": 0.9}]
+        signals = _strategist()._parse_batch_response(response, [_intel("BTC/AUD")], RISK)
+        assert signals[0].action == TradeAction.HOLD
+
+
+# ---------------------------------------------------------------------------
+# Rule-based batch
+# ---------------------------------------------------------------------------
+
+class TestRuleBasedBatch:
+    def test_rules_per_pair(self):
+        intel_list = [
+            _intel("BTC/AUD", direction=0.5, confidence=0.7),
+            _intel("ETH/AUD", direction=-0.5, confidence=0.7),
+            _intel("SOL/AUD", direction=0.1, confidence=0.8),
+        ]
+        plan = _run(RuleBasedBatchStrategist(Settings()).create_batch_plan(intel_list, Portfolio(), RISK))
+
+        actions = [s.action for s in plan.signals]
+        assert actions == [TradeAction.BUY, TradeAction.SELL, TradeAction.HOLD]
+        assert plan.signals[0].size_pct == RISK["max_position_pct"] * 0.7
+        assert plan.signals[1].size_pct == 1.0
+        assert plan.signals[2].confidence == 0.4
+        assert plan.signals[0].reasoning == "Rule-based batch: Bullish (+0.50)"
+        assert plan.overall_confidence == 0.7
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+class TestResponseCache:
+    def test_identical_prompt_reuses_response(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = [{"pair": "BTC/AUD", "action": "BUY", "confidence": 0.8}]
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+
+        intel_list = [_intel("BTC/AUD", direction=0.5, confidence=0.7)]
+        first = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+        second = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 1
+        assert first.signals[0].action == second.signals[0].action == TradeAction.BUY
+
+    def test_changed_intel_misses_cache(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = []
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+
+        _run(strategist.create_batch_plan([_intel("BTC/AUD", 0.5, 0.7)], Portfolio(), RISK))
+        _run(strategist.create_batch_plan([_intel("BTC/AUD", -0.5, 0.7)], Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 2
+
+    def test_unparseable_response_is_not_cached(self):
+        llm = AsyncMock()
+        llm.analyze_market.side_effect = [
+            "I cannot help with that.",
+            [{"pair": "BTC/AUD", "action": "BUY", "confidence": 0.8}],
+            [{"pair": "BTC/AUD", "action": "SELL", "confidence": 0.8}],
+        ]
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+
+        plans = [_run(strategist.create_batch_plan([_intel("BTC/AUD")], Portfolio(), RISK)) for _ in range(3)]
+
+        assert llm.analyze_market.await_count == 2
+        assert [p.signals[0].action for p in plans] == [TradeAction.HOLD, TradeAction.BUY, TradeAction.BUY]
+
+
+# ---------------------------------------------------------------------------
+# Micro-batching
+# ---------------------------------------------------------------------------
+
+class TestMicroBatching:
+    def test_concurrent_create_plan_calls_share_one_batch(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = [
+            {"pair": "BTC/AUD", "action": "BUY", "confidence": 0.8},
+            {"pair": "ETH/AUD", "action": "SELL", "confidence": 0.7},
+        ]
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+        portfolio = Portfolio()
+
+        async def run():
+            return await asyncio.gather(
+                strategist.create_plan(_intel("BTC/AUD"), portfolio, RISK),
+                strategist.create_plan(_intel("ETH/AUD"), portfolio, RISK),
+            )
+
+        btc_plan, eth_plan = _run(run())
+
+        assert llm.analyze_market.await_count == 1
+        assert [s.pair for s in btc_plan.signals] == ["BTC/AUD"]
+        assert btc_plan.signals[0].action == TradeAction.BUY
+        assert eth_plan.signals[0].action == TradeAction.SELL
+
+
+# ---------------------------------------------------------------------------
+# Deferred (Message Batches API) routing
+# ---------------------------------------------------------------------------
+
+class TestDeferredBatch:
+    def test_large_latency_budget_uses_batch_api(self):
+        llm = AsyncMock()
+        llm.analyze_market_batch.return_value = {
+            "batch": {"decisions": [{"pair": "BTC/AUD", "action": "SELL", "confidence": 0.7}]}
+        }
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+
+        plan = _run(strategist.create_batch_plan(
+            [_intel("BTC/AUD")], Portfolio(), RISK, latency_budget_ms=600_000
+        ))
+
+        assert llm.analyze_market.await_count == 0
+        assert llm.analyze_market_batch.await_count == 1
+        assert plan.signals[0].action == TradeAction.SELL
+
+    def test_small_latency_budget_stays_real_time(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = []
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+
+        _run(strategist.create_batch_plan([_intel("BTC/AUD")], Portfolio(), RISK, latency_budget_ms=5_000))
+
+        assert llm.analyze_market.await_count == 1
+        assert llm.analyze_market_batch.await_count == 0
+
+    def test_timed_out_batch_falls_back_to_real_time(self):
+        llm = AsyncMock()
+        llm.analyze_market_batch.side_effect = TimeoutError("Message batch did not finish")
+        llm.analyze_market.return_value = [{"pair": "BTC/AUD", "action": "SELL", "confidence": 0.7}]
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+
+        plan = _run(strategist.create_batch_plan(
+            [_intel("BTC/AUD")], Portfolio(), RISK, latency_budget_ms=600_000
+        ))
+
+        assert llm.analyze_market.await_count == 1
+        assert plan.signals[0].action == TradeAction.SELL
+
+
+# ---------------------------------------------------------------------------
+# Streamed responses
+# ---------------------------------------------------------------------------
+
+class StreamingLLM:
+    """Streams a canned response in fixed-size fragments."""
+
+    def __init__(self, response: str, chunk_size: int = 7):
+        self.response = response
+        self.chunk_size = chunk_size
+        self.calls = 0
+        self.finished = False
+
+    async def stream_market_analysis(self, prompt, system_prompt=None, max_tokens=1000, tool=None):
+        self.calls += 1
+        for i in range(0, len(self.response), self.chunk_size):
+            yield self.response[i:i + self.chunk_size]
+            await asyncio.sleep(0)
+        self.finished = True
+
+
+class TestStreamedResponse:
+    def test_decisions_split_across_chunks(self):
+        llm = StreamingLLM(
+            '{"decisions": [{"pair": "BTC/AUD", "action": "BUY", "confidence": 0.8, '
+            '"reasoning": "breakout {above} [resistance] \\"hard\\""}, '
+            '{"pair": "ETH/AUD", "action": "SELL", "confidence": 0.7}]}'
+        )
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+
+        plan = _run(strategist.create_batch_plan(
+            [_intel("BTC/AUD"), _intel("ETH/AUD")], Portfolio(), RISK
+        ))
+
+        assert llm.calls == 1
+        assert [s.action for s in plan.signals] == [TradeAction.BUY, TradeAction.SELL]
+        assert plan.signals[0].reasoning == 'breakout {above} [resistance] "hard"'
+
+    def test_pooled_callers_resolve_as_decisions_arrive(self):
+        llm = StreamingLLM(
+            '[{"pair": "BTC/AUD", "action": "BUY", "confidence": 0.8},'
+            + " " * 400
+            + '{"pair": "ETH/AUD", "action": "SELL", "confidence": 0.7}]'
+        )
+        strategist = BatchStrategist(llm=llm, settings=Settings())
+        portfolio = Portfolio()
+        finished = []
+
+        async def call(pair):
+            plan = await strategist.create_plan(_intel(pair), portfolio, RISK)
+            finished.append((pair, llm.finished))
+            return plan
+
+        async def run():
+            return await asyncio.gather(call("BTC/AUD"), call("ETH/AUD"))
+
+        btc_plan, eth_plan = _run(run())
+
+        # BTC's caller is answered while the ETH decision is still streaming
+        assert finished[0] == ("BTC/AUD", False)
+        assert btc_plan.signals[0].action == TradeAction.BUY
+        assert eth_plan.signals[0].action == TradeAction.SELL
+
+    def test_lone_caller_skips_the_batch_window(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = [{"pair": "BTC/AUD", "action": "BUY", "confidence": 0.8}]
+        strategist = BatchStrategist(llm=llm, settings=Settings(), batch_window_ms=10_000)
+
+        async def run():
+            return await asyncio.wait_for(strategist.create_plan(_intel("BTC/AUD"), Portfolio(), RISK), 1.0)
+
+        plan = _run(run())
+
+        assert llm.analyze_market.await_count == 1
+        assert plan.signals[0].action == TradeAction.BUY
+
+
+# ---------------------------------------------------------------------------
+# Input token budget
+# ---------------------------------------------------------------------------
+
+class TestInputBudget:
+    def test_oversized_batch_is_split(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = []
+        settings = Settings()
+        settings.cost_optimization.max_input_tokens = 240
+        strategist = BatchStrategist(llm=llm, settings=settings)
+
+        intel_list = [_intel(f"P{i}/AUD") for i in range(4)]
+        plan = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count > 1
+        assert [s.pair for s in plan.signals] == [intel.pair for intel in intel_list]
+
+    def test_oversized_single_pair_is_held_without_a_call(self):
+        llm = AsyncMock()
+        settings = Settings()
+        settings.cost_optimization.max_input_tokens = 10
+        strategist = BatchStrategist(llm=llm, settings=settings)
+
+        plan = _run(strategist.create_batch_plan([_intel("BTC/AUD")], Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 0
+        assert plan.signals[0].action == TradeAction.HOLD
+
+    def test_large_batch_is_sharded_by_pair_count(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = []
+        settings = Settings()
+        settings.cost_optimization.max_pairs_per_batch = 2
+        strategist = BatchStrategist(llm=llm, settings=settings)
+
+        intel_list = [_intel(f"P{i}/AUD") for i in range(5)]
+        plan = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 3
+        assert [s.pair for s in plan.signals] == [intel.pair for intel in intel_list]
@@ -0,0 +1,276 @@
+"""Tests for the cost-optimized strategist and its decision cache."""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from agents.strategist.cost_optimized import CostOptimizedStrategist, InMemoryDecisionCache, TieredDecisionCache
+from agents.strategist.hybrid import AdaptiveHybridStrategist, BatchSizeController, HybridStrategist
+from agents.strategist.simple import SimpleStrategist
+from core.config import Settings
+from core.models import MarketIntel, Portfolio, TradeAction, TradeSignal, TradingPlan
+
+RISK = {"max_position_pct": 0.2, "stop_loss_pct": 0.05, "min_confidence": 0.6}
+
+
+def _intel(pair: str, direction: float = 0.0, confidence: float = 0.5) -> MarketIntel:
+    return MarketIntel(pair=pair, signals=[], fused_direction=direction, fused_confidence=confidence)
+
+
+def _run(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+# ---------------------------------------------------------------------------
+# In-memory decision cache
+# ---------------------------------------------------------------------------
+
+class TestInMemoryDecisionCache:
+    def test_evicts_least_recently_used(self):
+        cache = InMemoryDecisionCache(max_entries=2)
+        _run(cache.cache_decision("BTC/AUD", "h", {"action": "BUY"}, 100.0))
+        _run(cache.cache_decision("ETH/AUD", "h", {"action": "SELL"}, 100.0))
+
+        # Reading BTC makes ETH the least recently used entry
+        assert _run(cache.get_cached_decision("BTC/AUD", "h", 100.0)) == {"action": "BUY"}
+        _run(cache.cache_decision("SOL/AUD", "h", {"action": "HOLD"}, 100.0))
+
+        assert _run(cache.get_cached_decision("ETH/AUD", "h", 100.0)) is None
+        assert _run(cache.get_cached_decision("BTC/AUD", "h", 100.0)) == {"action": "BUY"}
+
+    def test_price_deviation_misses(self):
+        cache = InMemoryDecisionCache()
+        _run(cache.cache_decision("BTC/AUD", "h", {"action": "BUY"}, 100.0))
+
+        assert _run(cache.get_cached_decision("BTC/AUD", "h", 101.0)) == {"action": "BUY"}
+        assert _run(cache.get_cached_decision("BTC/AUD", "h", 110.0)) is None
+
+    def test_expired_entry_misses(self):
+        cache = InMemoryDecisionCache()
+        _run(cache.cache_decision("BTC/AUD", "h", {"action": "BUY"}, 100.0, ttl=-1))
+
+        assert _run(cache.get_cached_decision("BTC/AUD", "h", 100.0)) is None
+
+    def test_write_sweeps_expired_entries(self):
+        cache = InMemoryDecisionCache()
+        _run(cache.cache_decision("BTC/AUD", "h", {"action": "BUY"}, 100.0, ttl=-1))
+        _run(cache.cache_decision("ETH/AUD", "h", {"action": "SELL"}, 100.0))
+
+        assert list(cache._cache) == ["decision:ETH/AUD:h"]
+
+
+class TestTieredDecisionCache:
+    def test_l1_then_l2_then_miss(self):
+        l2 = InMemoryDecisionCache()
+        cache = TieredDecisionCache(l1=InMemoryDecisionCache(), l2=l2)
+        _run(cache.cache_decision("BTC/AUD", "h", {"action": "BUY"}, 100.0))
+        _run(l2.cache_decision("ETH/AUD", "h", {"action": "SELL"}, 100.0))   # e.g. written by another process
+
+        results = _run(cache.get_cached_decisions_bulk([
+            ("BTC/AUD", "h", 100.0), ("ETH/AUD", "h", 100.0), ("SOL/AUD", "h", 100.0)
+        ]))
+
+        assert results == [{"action": "BUY"}, {"action": "SELL"}, None]
+        assert cache.get_tier_stats() == {"l1_hits": 1, "l2_hits": 1, "misses": 1}
+        assert _run(l2.get_cached_decision("BTC/AUD", "h", 100.0)) == {"action": "BUY"}
+
+# ---------------------------------------------------------------------------
+
+class TestCostOptimizedBatch:
+    def test_second_batch_is_served_from_cache(self):
+        llm = AsyncMock()
+        strategist = CostOptimizedStrategist(llm=llm, settings=Settings())
+        intel_list = [
+            _intel("BTC/AUD", direction=0.8, confidence=0.9),   # clear -> rules
+            _intel("ETH/AUD", direction=-0.8, confidence=0.9),
+        ]
+
+        first = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+        second = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert strategist._cache_hits == 2
+        assert [s.pair for s in second.signals] == ["BTC/AUD", "ETH/AUD"]
+        assert [s.action for s in second.signals] == [s.action for s in first.signals]
+        assert first.signals[0].action == TradeAction.BUY
+
+    def test_risk_params_change_misses_cache(self):
+        strategist = CostOptimizedStrategist(llm=AsyncMock(), settings=Settings())
+        intel_list = [_intel("BTC/AUD", direction=0.8, confidence=0.9)]
+
+        _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+        _run(strategist.create_batch_plan(intel_list, Portfolio(), {**RISK, "max_position_pct": 0.1}))
+        assert strategist._cache_hits == 0
+
+        # Same params in a different order share the entry
+        _run(strategist.create_batch_plan(intel_list, Portfolio(), dict(reversed(RISK.items()))))
+        assert strategist._cache_hits == 1
+
+    def test_rules_only_bypasses_cache(self):
+        strategist = CostOptimizedStrategist(llm=None, settings=Settings())
+        intel_list = [
+            _intel("BTC/AUD", direction=0.5, confidence=0.7),
+            _intel("ETH/AUD", direction=-0.5, confidence=0.7),
+        ]
+
+        plan = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+        _run(strategist.create_plan(intel_list[0], Portfolio(), RISK))
+
+        assert [s.action for s in plan.signals] == [TradeAction.BUY, TradeAction.SELL]
+        assert strategist._cache_hits == 0
+        assert not strategist.cache._cache
+
+    def test_hybrid_batch_keeps_input_order(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = [{"pair": "ETH/AUD", "action": "SELL", "confidence": 0.7}]
+        strategist = CostOptimizedStrategist(llm=llm, settings=Settings())
+        intel_list = [
+            _intel("ETH/AUD", direction=0.1, confidence=0.5),   # uncertain -> Claude
+            _intel("BTC/AUD", direction=0.8, confidence=0.9),   # clear -> rules
+        ]
+
+        plan = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert [s.pair for s in plan.signals] == ["ETH/AUD", "BTC/AUD"]
+        assert [s.action for s in plan.signals] == [TradeAction.SELL, TradeAction.BUY]
+        assert llm.analyze_market.await_count == 1
+
+        # Each pair's decision was cached under its own key
+        cached = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+        assert {s.pair: s.action for s in cached.signals} == {
+            "ETH/AUD": TradeAction.SELL, "BTC/AUD": TradeAction.BUY
+        }
+
+    def test_matching_intel_is_decided_once(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = [{"pair": "ETH/AUD", "action": "SELL", "confidence": 0.7}]
+        strategist = CostOptimizedStrategist(llm=llm, settings=Settings())
+        intel_list = [
+            _intel("ETH/AUD", direction=0.1, confidence=0.5),
+            _intel("SOL/AUD", direction=0.1, confidence=0.5),
+        ]
+
+        plan = _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert [s.pair for s in plan.signals] == ["ETH/AUD", "SOL/AUD"]
+        assert [s.action for s in plan.signals] == [TradeAction.SELL, TradeAction.SELL]
+        assert "SOL/AUD" not in llm.analyze_market.await_args.kwargs["prompt"]
+        assert strategist.get_stats()["coalesced_hits"] == 1
+
+    def test_deferred_batch_requires_opt_in(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = []
+        llm.analyze_market_batch.return_value = {"batch": []}
+        settings = Settings()
+        strategist = CostOptimizedStrategist(llm=llm, settings=settings)
+        intel_list = [_intel("ETH/AUD", direction=0.1, confidence=0.5)]
+
+        _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK, latency_budget_ms=3_600_000))
+        assert llm.analyze_market_batch.await_count == 0
+
+        settings.cost_optimization.allow_deferred_batch = True
+        intel_list = [_intel("SOL/AUD", direction=-0.1, confidence=0.5)]
+        _run(strategist.create_batch_plan(intel_list, Portfolio(), RISK, latency_budget_ms=3_600_000))
+        assert llm.analyze_market_batch.await_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Hybrid per-pair fallback
+# ---------------------------------------------------------------------------
+
+class SlowStrategist:
+    """Single-pair LLM strategist (no create_batch_plan) that tracks overlap."""
+
+    def __init__(self, fail_pair: str = None):
+        self.fail_pair = fail_pair
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create_plan(self, intel, portfolio, risk_params=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if intel.pair == self.fail_pair:
+            raise RuntimeError("API error")
+        return TradingPlan(signals=[TradeSignal(
+            pair=intel.pair, action=TradeAction.SELL, confidence=0.7, size_pct=1.0, reasoning="llm"
+        )])
+
+
+class TestHybridFallback:
+    def test_uncertain_pairs_are_decided_concurrently(self):
+        settings = Settings()
+        settings.cost_optimization.max_concurrent_llm_calls = 2
+        llm_strategist = SlowStrategist(fail_pair="SOL/AUD")
+        hybrid = HybridStrategist(llm_strategist=llm_strategist, settings=settings)
+        intel_list = [_intel(pair, direction=0.1, confidence=0.5) for pair in ("BTC/AUD", "ETH/AUD", "SOL/AUD")]
+
+        plan = _run(hybrid.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert llm_strategist.max_in_flight == 2
+        assert [s.pair for s in plan.signals] == ["BTC/AUD", "ETH/AUD", "SOL/AUD"]
+        failed = plan.signals[2]
+        assert failed.action == TradeAction.HOLD
+        assert "API error" in failed.reasoning
+
+    def test_failed_marshaled_shard_retries_only_its_pairs(self):
+        settings = Settings()
+        settings.cost_optimization.adaptive_batch_size = True
+        settings.cost_optimization.max_pairs_per_batch = 2
+        llm_strategist = SlowStrategist(fail_pair="SOL/AUD")
+        llm_strategist.llm = AsyncMock()
+        hybrid = HybridStrategist(llm_strategist=llm_strategist, settings=settings)
+        intel_list = [_intel(pair, direction=0.1, confidence=0.5) for pair in ("BTC/AUD", "ETH/AUD", "SOL/AUD")]
+
+        async def create_batch_plan(chunk, portfolio, risk_params=None):
+            if any(intel.pair == "SOL/AUD" for intel in chunk):
+                raise RuntimeError("batch down")
+            return TradingPlan(signals=[TradeSignal(
+                pair=intel.pair, action=TradeAction.BUY, confidence=0.7, size_pct=1.0, reasoning="batch"
+            ) for intel in chunk])
+
+        hybrid._marshal_strategist = SimpleNamespace(create_batch_plan=create_batch_plan)
+        plan = _run(hybrid.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert [s.action for s in plan.signals] == [TradeAction.BUY, TradeAction.BUY, TradeAction.HOLD]
+        assert "API error" in plan.signals[2].reasoning
+
+    def test_uncertain_pairs_share_one_prompt(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = [
+            {"pair": "BTC/AUD", "action": "BUY", "confidence": 0.7},
+            {"pair": "ETH/AUD", "action": "SELL", "confidence": 0.7},
+        ]
+        hybrid = HybridStrategist(llm_strategist=SimpleStrategist(llm, Settings()), settings=Settings())
+        intel_list = [_intel(pair, direction=0.1, confidence=0.5) for pair in ("BTC/AUD", "ETH/AUD")]
+
+        plan = _run(hybrid.create_batch_plan(intel_list, Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 1
+        assert [s.action for s in plan.signals] == [TradeAction.BUY, TradeAction.SELL]
+
+
+class TestAdaptiveHybrid:
+    def test_win_rates_cover_recent_window(self):
+        hybrid = AdaptiveHybridStrategist(llm_strategist=None, settings=Settings())
+        hybrid.OUTCOME_WINDOW = 20
+        for _ in range(20):
+            hybrid.record_outcome(was_rule_based=True, was_profitable=False)
+        for _ in range(10):
+            hybrid.record_outcome(was_rule_based=True, was_profitable=True)
+
+        assert (hybrid._rule_wins, hybrid._rule_losses) == (10, 10)
+
+
+class TestBatchSizeController:
+    def test_reverses_when_throughput_drops(self):
+        sizer = BatchSizeController(max_size=10)
+        sizer.record(10, 1.0)           # 10 pairs/s, shrink
+        assert sizer.target == 9
+        sizer.record(9, 0.5)            # 18 pairs/s, keep shrinking
+        assert sizer.target == 8
+        sizer.record(8, 1.0)            # 8 pairs/s, worse: grow again
+        assert sizer.target == 9
@@ -0,0 +1,270 @@
+"""Tests for the single-pair strategists."""
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from agents.orchestrator.base import Orchestrator
+from agents.strategist.simple import RuleBasedStrategist, SimpleStrategist
+from core.config import Settings
+from core.ml import DecisionDistiller
+from core.models import MarketIntel, Portfolio, Position, TradeAction
+
+RISK = {"max_position_pct": 0.2, "stop_loss_pct": 0.05, "min_confidence": 0.6}
+
+
+def _intel(pair: str, direction: float = 0.0, confidence: float = 0.5) -> MarketIntel:
+    return MarketIntel(pair=pair, signals=[], fused_direction=direction, fused_confidence=confidence)
+
+
+def _run(coro):
+    # Own loop: earlier test modules may leave no current event loop behind
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+class TestResponseCache:
+    def test_identical_prompt_reuses_decision(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = {"action": "BUY", "confidence": 0.8, "size_pct": 0.1}
+        strategist = SimpleStrategist(llm, Settings())
+
+        first = _run(strategist.create_plan(_intel("BTC/AUD", 0.5, 0.7), Portfolio(), RISK))
+        second = _run(strategist.create_plan(_intel("BTC/AUD", 0.5, 0.7), Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 1
+        assert llm.analyze_market.await_args.kwargs["tool"]["name"] == "emit_trade_decision"
+        assert first.signals[0].action == second.signals[0].action == TradeAction.BUY
+
+    def test_failed_call_is_not_cached(self):
+        llm = AsyncMock()
+        llm.analyze_market.side_effect = [RuntimeError("API error"), {"action": "SELL", "confidence": 0.7}]
+        strategist = SimpleStrategist(llm, Settings())
+
+        first = _run(strategist.create_plan(_intel("ETH/AUD", -0.5, 0.7), Portfolio(), RISK))
+        second = _run(strategist.create_plan(_intel("ETH/AUD", -0.5, 0.7), Portfolio(), RISK))
+
+        assert first.signals[0].action == TradeAction.HOLD
+        assert second.signals[0].action == TradeAction.SELL
+
+    def test_jittered_intel_reuses_decision(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = {"action": "BUY", "confidence": 0.8, "size_pct": 0.1}
+        strategist = SimpleStrategist(llm, Settings())
+
+        _run(strategist.create_plan(_intel("BTC/AUD", 0.501, 0.702), Portfolio(), RISK))
+        _run(strategist.create_plan(_intel("BTC/AUD", 0.508, 0.698), Portfolio(), RISK))
+        assert llm.analyze_market.await_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Deterministic HOLD
+# ---------------------------------------------------------------------------
+
+class TestForcedHold:
+    def test_outside_thresholds_skips_llm(self):
+        llm = AsyncMock()
+        strategist = SimpleStrategist(llm, Settings())
+
+        plan = _run(strategist.create_plan(_intel("BTC/AUD", 0.3, 0.9), Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 0
+        assert plan.signals[0].action == TradeAction.HOLD
+        assert plan.signals[0].confidence == 0.45
+
+    def test_held_asset_is_not_rebought(self):
+        llm = AsyncMock()
+        strategist = SimpleStrategist(llm, Settings())
+        portfolio = Portfolio()
+        portfolio.positions["BTC"] = Position(symbol="BTC", amount=0.1, entry_price=50000.0, current_price=50000.0)
+
+        plan = _run(strategist.create_plan(_intel("BTC/AUD", 0.8, 0.9), portfolio, RISK))
+
+        assert llm.analyze_market.await_count == 0
+        assert plan.signals[0].action == TradeAction.HOLD
+
+
+# ---------------------------------------------------------------------------
+# Concurrent plans
+# ---------------------------------------------------------------------------
+
+class TestConcurrentPlans:
+    def test_calls_are_bounded_and_keep_order(self):
+        in_flight = []
+        peak = []
+
+        async def analyze_market(prompt, system_prompt=None, max_tokens=1000, tool=None):
+            in_flight.append(prompt)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(prompt)
+            if "SOL/AUD" in prompt:
+                raise RuntimeError("API error")
+            return {"action": "SELL", "confidence": 0.7, "size_pct": 1.0}
+
+        llm = AsyncMock()
+        llm.analyze_market.side_effect = analyze_market
+        strategist = SimpleStrategist(llm, Settings())
+        intel_list = [_intel(pair, -0.5, 0.7) for pair in ("BTC/AUD", "ETH/AUD", "SOL/AUD", "ADA/AUD")]
+
+        plans = _run(strategist.create_plans(intel_list, Portfolio(), RISK, max_concurrency=2))
+
+        assert max(peak) == 2
+        assert [p.signals[0].pair for p in plans] == [intel.pair for intel in intel_list]
+        assert [p.signals[0].action for p in plans] == [
+            TradeAction.SELL, TradeAction.SELL, TradeAction.HOLD, TradeAction.SELL
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Message Batches API
+# ---------------------------------------------------------------------------
+
+class TestBatchPlans:
+    def test_uncertain_pairs_share_one_message_batch(self):
+        llm = AsyncMock()
+        llm.analyze_market_batch.return_value = {
+            "pair-0": {"action": "BUY", "confidence": 0.8, "size_pct": 0.1},
+            "pair-2": {"action": "SELL", "confidence": 0.7, "size_pct": 1.0},
+        }
+        settings = Settings()
+        settings.cost_optimization.allow_deferred_batch = True
+        strategist = SimpleStrategist(llm, settings)
+        intel_list = [
+            _intel("BTC/AUD", 0.5, 0.7),
+            _intel("ETH/AUD", 0.1, 0.5),    # forced HOLD, not submitted
+            _intel("SOL/AUD", -0.5, 0.7),
+            _intel("ADA/AUD", -0.5, 0.8),   # missing from results
+        ]
+
+        plans = _run(strategist.create_plans_batch(intel_list, Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 0
+        requests = llm.analyze_market_batch.await_args.args[0]
+        assert [r["custom_id"] for r in requests] == ["pair-0", "pair-2", "pair-3"]
+        assert [p.signals[0].action for p in plans] == [
+            TradeAction.BUY, TradeAction.HOLD, TradeAction.SELL, TradeAction.HOLD
+        ]
+        assert plans[3].strategy_name == "error"
+
+    def test_without_opt_in_calls_in_real_time(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = {"action": "BUY", "confidence": 0.8, "size_pct": 0.1}
+        strategist = SimpleStrategist(llm, Settings())
+
+        _run(strategist.create_plans_batch([_intel("BTC/AUD", 0.5, 0.7)], Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 1
+        assert llm.analyze_market_batch.await_count == 0
+
+
+# ---------------------------------------------------------------------------
+# Prompt context
+# ---------------------------------------------------------------------------
+
+class TestPromptContext:
+    def test_reused_until_portfolio_changes(self):
+        strategist = SimpleStrategist(AsyncMock(), Settings())
+        portfolio = Portfolio(available_quote=1000.0)
+
+        first = strategist._prompt_context(portfolio, RISK)
+        assert strategist._prompt_context(portfolio, RISK) is first
+
+        portfolio.positions["BTC"] = Position(symbol="BTC", amount=0.1, entry_price=100.0, current_price=100.0)
+        changed = strategist._prompt_context(portfolio, RISK)
+        assert changed is not first
+        assert changed["held_assets"] == {"BTC"}
+        assert strategist._prompt_context(portfolio, {**RISK, "stop_loss_pct": 0.1}) is not changed
+
+
+# ---------------------------------------------------------------------------
+# Decision distiller
+# ---------------------------------------------------------------------------
+
+class TestDecisionDistiller:
+    def test_consistent_bin_skips_llm(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = {"action": "SELL", "confidence": 0.7, "size_pct": 1.0}
+        distiller = DecisionDistiller(min_samples=2)
+        strategist = SimpleStrategist(llm, Settings(), semantic_bucket=0, distiller=distiller)
+
+        for direction in (-0.51, -0.52, -0.53):
+            plan = _run(strategist.create_plan(_intel("ETH/AUD", direction, 0.7), Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 2
+        assert plan.signals[0].action == TradeAction.SELL
+        assert plan.strategy_name == "distilled"
+
+    def test_split_bin_abstains(self):
+        distiller = DecisionDistiller(min_samples=2)
+        intel = _intel("ETH/AUD", -0.5, 0.7)
+        distiller.record(intel, False, 0.2, {"action": "SELL", "confidence": 0.7})
+        distiller.record(intel, False, 0.2, {"action": "HOLD", "confidence": 0.4})
+
+        assert distiller.predict(intel, False, 0.2) is None
+        assert distiller.predict(intel, True, 0.2) is None
+
+    def test_risk_limit_is_part_of_the_bin(self):
+        distiller = DecisionDistiller(min_samples=2)
+        intel = _intel("ETH/AUD", -0.5, 0.7)
+        distiller.record(intel, False, 0.2, {"action": "SELL", "confidence": 0.7, "size_pct": 1.0})
+        distiller.record(intel, False, 0.2, {"action": "SELL", "confidence": 0.7, "size_pct": 1.0})
+
+        assert distiller.predict(intel, False, 0.2)["action"] == "SELL"
+        assert distiller.predict(intel, False, 0.5) is None
+
+    def test_shadow_check_calls_llm_and_counts_disagreement(self):
+        llm = AsyncMock()
+        llm.analyze_market.return_value = {"action": "HOLD", "confidence": 0.5, "size_pct": 0.0}
+        distiller = DecisionDistiller(min_samples=2, shadow_rate=1.0)
+        intel = _intel("ETH/AUD", -0.5, 0.7)
+        distiller.record(intel, False, 0.2, {"action": "SELL", "confidence": 0.7})
+        distiller.record(intel, False, 0.2, {"action": "SELL", "confidence": 0.7})
+        strategist = SimpleStrategist(llm, Settings(), semantic_bucket=0, distiller=distiller)
+
+        plan = _run(strategist.create_plan(intel, Portfolio(), RISK))
+
+        assert llm.analyze_market.await_count == 1
+        assert plan.signals[0].action == TradeAction.HOLD
+        stats = distiller.get_stats()
+        assert stats["shadow_checks"] == 1
+        assert stats["disagreements"] == 1
+
+    def test_enabled_from_settings(self):
+        settings = Settings()
+        assert SimpleStrategist(AsyncMock(), settings).distiller is None
+
+        settings.cost_optimization.enable_decision_distiller = True
+        settings.cost_optimization.distiller_shadow_rate = 0.25
+        strategist = SimpleStrategist(AsyncMock(), settings)
+        assert strategist.distiller is not None
+        assert strategist.distiller.shadow_rate == 0.25
+
+
+class TestRuleBasedStrategist:
+    def test_orchestrator_keeps_sequential_mode(self):
+        # Batch helpers must not make the orchestrator switch to batch mode
+        orch = Orchestrator.__new__(Orchestrator)
+        orch.strategist = RuleBasedStrategist(Settings())
+        assert not orch._supports_batch_mode()
+
+    def test_batch_matches_per_pair_rules(self):
+        strategist = RuleBasedStrategist(Settings())
+        intel_list = [
+            MarketIntel(pair="BTC/AUD", signals=[], fused_direction=0.8, fused_confidence=0.9),
+            MarketIntel(pair="ETH/AUD", signals=[], fused_direction=0.0, fused_confidence=0.5),
+        ]
+
+        batch = _run(strategist.decide_batch(intel_list, Portfolio()))
+        single = [_run(strategist.create_plan(intel, Portfolio())).signals[0] for intel in intel_list]
+
+        assert [s.action for s in batch.signals] == [s.action for s in single]